@@ -2,19 +2,29 @@ import discord
 from discord.ext import commands, tasks
 from discord import app_commands
 import asyncio
+import functools
 import aiohttp
 import aiofiles
+import aiosqlite
 import os
 import json
-import sqlite3
-import secrets
+import orjson
+import random
+import shutil
 import string
 import hashlib
 from datetime import datetime, timezone
-from typing import Optional, Dict, List
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, List, Tuple
 import psutil
+from cachetools import TTLCache
 from dotenv import load_dotenv
 import logging
+import time
+from collections import defaultdict, namedtuple
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 # ============================================
 # 🔧 LOGGING SETUP
@@ -59,11 +69,21 @@ INTENTS = discord.Intents.default()
 INTENTS.message_content = True
 INTENTS.members = True
 
-bot = commands.Bot(command_prefix="!", intents=INTENTS)
+class VPSManagerBot(commands.Bot):
+    """Bot subclass that releases shared resources on shutdown"""
+
+    async def close(self):
+        await close_http_session()
+        await db_pool.close()
+        await super().close()
+
+bot = VPSManagerBot(command_prefix="!", intents=INTENTS)
 bot.owner_id = OWNER_ID
 
 # Database
 DB_FILE = "vps_manager.db"
+DB_POOL_SIZE = 4  # Writes are serialized by the pool, reads run in parallel
+DB_STATEMENT_CACHE_SIZE = 128  # Prepared statements kept per connection
 os.makedirs(VM_DIR, exist_ok=True)
 
 # OS Images Configuration
@@ -118,102 +138,348 @@ OS_IMAGES = {
     }
 }
 
+# Flat display-name lookup for embeds
+OS_NAME_BY_KEY = {key: config["name"] for key, config in OS_IMAGES.items()}
+
 # ============================================
 # 🗄️ DATABASE FUNCTIONS
 # ============================================
 
-def init_database():
+class SQLiteConnectionPool:
+    """Small pool of persistent aiosqlite connections.
+
+    Connections are opened lazily up to ``size`` and handed back to the pool
+    after use, so SQLite's page cache stays warm between queries and no
+    blocking I/O happens on the event loop thread. ``execute`` and
+    ``transaction`` hold a write lock, so only one write runs at a time
+    and writers queue here instead of spinning on SQLite's busy timeout.
+    """
+
+    def __init__(self, db_file: str, size: int = DB_POOL_SIZE):
+        self.db_file = db_file
+        self.size = size
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._connections: List[aiosqlite.Connection] = []
+        self._opened = 0
+        self._write_lock = asyncio.Lock()
+
+    async def _open_connection(self) -> aiosqlite.Connection:
+        """Open a new connection and apply the performance PRAGMAs"""
+        conn = await aiosqlite.connect(self.db_file, cached_statements=DB_STATEMENT_CACHE_SIZE)
+        # journal_mode is persisted in the database file, the rest are per-connection
+        await conn.execute("PRAGMA journal_mode=WAL")
+        await conn.execute("PRAGMA synchronous=normal")
+        await conn.execute("PRAGMA temp_store=memory")
+        await conn.execute("PRAGMA cache_size=-64000")
+        self._connections.append(conn)
+        return conn
+
+    async def open(self):
+        """Open any connections not yet created so commands never pay the connect cost"""
+        while self._opened < self.size:
+            self._opened += 1
+            try:
+                conn = await self._open_connection()
+            except Exception:
+                self._opened -= 1
+                raise
+            self._idle.put_nowait(conn)
+
+    async def _acquire(self) -> aiosqlite.Connection:
+        if self._idle.empty() and self._opened < self.size:
+            self._opened += 1
+            try:
+                return await self._open_connection()
+            except Exception:
+                self._opened -= 1
+                raise
+        return await self._idle.get()
+
+    @asynccontextmanager
+    async def connection(self):
+        """Borrow a connection from the pool"""
+        conn = await self._acquire()
+        try:
+            yield conn
+        except BaseException:
+            if conn.in_transaction:
+                await conn.rollback()
+            raise
+        finally:
+            self._idle.put_nowait(conn)
+
+    @asynccontextmanager
+    async def transaction(self):
+        """Borrow a connection wrapped in a single BEGIN IMMEDIATE/COMMIT"""
+        async with self._write_lock, self.connection() as conn:
+            await conn.execute("BEGIN IMMEDIATE")
+            yield conn
+            await conn.commit()
+
+    async def fetchone(self, sql: str, params: tuple = ()) -> Optional[tuple]:
+        """Run a query and return its first row"""
+        async with self.connection() as conn:
+            async with conn.execute(sql, params) as cursor:
+                return await cursor.fetchone()
+
+    async def fetchall(self, sql: str, params: tuple = ()) -> List[tuple]:
+        """Run a query and return all rows"""
+        async with self.connection() as conn:
+            return list(await conn.execute_fetchall(sql, params))
+
+    async def execute(self, sql: str, params: tuple = ()) -> int:
+        """Run a write statement, commit it and return the affected row count"""
+        async with self._write_lock, self.connection() as conn:
+            async with conn.execute(sql, params) as cursor:
+                rowcount = cursor.rowcount
+            await conn.commit()
+        return rowcount
+
+    async def close(self):
+        """Close every pooled connection"""
+        for conn in self._connections:
+            await conn.close()
+        self._connections.clear()
+        self._opened = 0
+        self._idle = asyncio.Queue()
+
+db_pool = SQLiteConnectionPool(DB_FILE)
+
+class VPSRecord(namedtuple(
+    'VPSRecord',
+    'id vps_id owner_id hostname username password ssh_port memory cpus disk_size '
+    'os_type image_file seed_file status pid created_at gui_mode port_forwards created_ts qemu_cmd'
+)):
+    """Typed view of a row from the vps table"""
+    
+    # Records live in the get_vps_by_id cache, so the connection strings are
+    # formatted once per record rather than once per command
+    @functools.cached_property
+    def ssh_command(self) -> str:
+        """Plain SSH command for this VPS"""
+        return f"ssh -p {self.ssh_port} {self.username}@{DEFAULT_HOSTNAME}"
+    
+    @functools.cached_property
+    def one_liner(self) -> str:
+        """Non-interactive sshpass login command"""
+        return (
+            f"sshpass -p '{self.password}' ssh -o StrictHostKeyChecking=no "
+            f"-p {self.ssh_port} {self.username}@{DEFAULT_HOSTNAME}"
+        )
+
+VPS_COLUMNS = ", ".join(VPSRecord._fields)
+
+# Just the columns the /list embed shows
+VPSSummary = namedtuple(
+    'VPSSummary',
+    'vps_id hostname os_type memory cpus disk_size ssh_port status created_ts'
+)
+VPS_SUMMARY_COLUMNS = ", ".join(VPSSummary._fields)
+
+# Hot-path statements. sqlite3 keeps an LRU of prepared statements per
+# connection keyed by the SQL text, so always pass these constants verbatim
+# instead of building SQL inline.
+
+SQL_IS_ADMIN = "SELECT user_id FROM admins WHERE user_id = ?"
+SQL_IS_BANNED = "SELECT user_id FROM banned_users WHERE user_id = ?"
+SQL_USER_VPS_UP_TO = "SELECT 1 FROM vps WHERE owner_id = ? LIMIT ?"
+SQL_GET_ALL_VPS = f"SELECT {VPS_SUMMARY_COLUMNS} FROM vps"
+SQL_GET_USER_VPS = f"SELECT {VPS_SUMMARY_COLUMNS} FROM vps WHERE owner_id = ?"
+SQL_GET_VPS_BY_ID = f"SELECT {VPS_COLUMNS} FROM vps WHERE vps_id = ?"
+SQL_GET_VPS_PID = "SELECT pid FROM vps WHERE vps_id = ?"
+SQL_SET_VPS_RUNNING = "UPDATE vps SET status = 'running', pid = ? WHERE vps_id = ?"
+SQL_SET_VPS_STOPPED = "UPDATE vps SET status = 'stopped', pid = NULL WHERE vps_id = ?"
+SQL_SET_VPS_QEMU_CMD = "UPDATE vps SET qemu_cmd = ? WHERE vps_id = ?"
+SQL_SET_VPS_PASSWORD = "UPDATE vps SET password = ? WHERE vps_id = ?"
+SQL_DELETE_VPS = "DELETE FROM vps WHERE vps_id = ?"
+SQL_GET_RUNNING_PIDS = "SELECT vps_id, pid FROM vps WHERE status = 'running'"
+SQL_VPS_COUNTS = "SELECT COALESCE(SUM(status = 'running'), 0), COUNT(*) FROM vps"
+SQL_INSERT_VPS = """
+    INSERT INTO vps (vps_id, owner_id, hostname, username, password, ssh_port,
+                    memory, cpus, disk_size, os_type, image_file, seed_file,
+                    gui_mode, port_forwards, created_ts, qemu_cmd)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+SQL_INCREMENT_STAT = "UPDATE statistics SET value = CAST(value AS INTEGER) + 1 WHERE key = ?"
+SQL_GET_STATS = "SELECT key, value FROM statistics"
+# Platform figures for /admin_stats, in one statement and a single pass over vps
+# (the counters in the statistics table are served from STATS)
+SQL_ADMIN_STATS = """
+    SELECT v.total, v.running, v.memory, v.cpus,
+           (SELECT COUNT(*) FROM banned_users),
+           (SELECT COUNT(*) FROM admins),
+           v.owners
+    FROM (SELECT COUNT(*) AS total,
+                 COALESCE(SUM(status = 'running'), 0) AS running,
+                 COALESCE(SUM(memory), 0) AS memory,
+                 COALESCE(SUM(cpus), 0) AS cpus,
+                 COUNT(DISTINCT owner_id) AS owners
+          FROM vps) AS v
+"""
+
+async def init_database():
     """Initialize SQLite database with all required tables"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    
-    # VPS Table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS vps (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            vps_id TEXT UNIQUE NOT NULL,
-            owner_id INTEGER NOT NULL,
-            hostname TEXT NOT NULL,
-            username TEXT NOT NULL,
-            password TEXT NOT NULL,
-            ssh_port INTEGER NOT NULL,
-            memory INTEGER NOT NULL,
-            cpus INTEGER NOT NULL,
-            disk_size TEXT NOT NULL,
-            os_type TEXT NOT NULL,
-            image_file TEXT NOT NULL,
-            seed_file TEXT NOT NULL,
-            status TEXT DEFAULT 'stopped',
-            pid INTEGER DEFAULT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            gui_mode INTEGER DEFAULT 0,
-            port_forwards TEXT
-        )
-    """)
-    
-    # Admins Table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS admins (
-            user_id INTEGER PRIMARY KEY,
-            added_by INTEGER NOT NULL,
-            added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-    
-    # Banned Users Table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS banned_users (
-            user_id INTEGER PRIMARY KEY,
-            banned_by INTEGER NOT NULL,
-            reason TEXT,
-            banned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-    
-    # Statistics Table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS statistics (
-            key TEXT PRIMARY KEY,
-            value TEXT NOT NULL
+    async with db_pool.connection() as conn:
+        # VPS Table
+        await conn.execute("""
+            CREATE TABLE IF NOT EXISTS vps (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                vps_id TEXT UNIQUE NOT NULL,
+                owner_id INTEGER NOT NULL,
+                hostname TEXT NOT NULL,
+                username TEXT NOT NULL,
+                password TEXT NOT NULL,
+                ssh_port INTEGER NOT NULL,
+                memory INTEGER NOT NULL,
+                cpus INTEGER NOT NULL,
+                disk_size TEXT NOT NULL,
+                os_type TEXT NOT NULL,
+                image_file TEXT NOT NULL,
+                seed_file TEXT NOT NULL,
+                status TEXT DEFAULT 'stopped',
+                pid INTEGER DEFAULT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                gui_mode INTEGER DEFAULT 0,
+                port_forwards TEXT,
+                created_ts INTEGER,
+                qemu_cmd TEXT
+            )
+        """)
+        
+        # Migrate databases created by older versions
+        columns = {row[1] for row in await conn.execute_fetchall("PRAGMA table_info(vps)")}
+        if 'created_ts' not in columns:
+            await conn.execute("ALTER TABLE vps ADD COLUMN created_ts INTEGER")
+            await conn.execute(
+                "UPDATE vps SET created_ts = CAST(strftime('%s', created_at) AS INTEGER) WHERE created_ts IS NULL"
+            )
+        if 'qemu_cmd' not in columns:
+            # Filled in lazily on the next start
+            await conn.execute("ALTER TABLE vps ADD COLUMN qemu_cmd TEXT")
+        
+        # Indexes for per-owner and per-status lookups and newest-first listings
+        await conn.execute("CREATE INDEX IF NOT EXISTS idx_vps_owner ON vps(owner_id)")
+        await conn.execute("CREATE INDEX IF NOT EXISTS idx_vps_status ON vps(status)")
+        await conn.execute("CREATE INDEX IF NOT EXISTS idx_vps_created_at ON vps(created_at DESC)")
+        
+        # Admins Table
+        await conn.execute("""
+            CREATE TABLE IF NOT EXISTS admins (
+                user_id INTEGER PRIMARY KEY,
+                added_by INTEGER NOT NULL,
+                added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # Banned Users Table
+        await conn.execute("""
+            CREATE TABLE IF NOT EXISTS banned_users (
+                user_id INTEGER PRIMARY KEY,
+                banned_by INTEGER NOT NULL,
+                reason TEXT,
+                banned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        await conn.execute("CREATE INDEX IF NOT EXISTS idx_banned_at ON banned_users(banned_at DESC)")
+        
+        # Statistics Table
+        await conn.execute("""
+            CREATE TABLE IF NOT EXISTS statistics (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            )
+        """)
+        
+        # Initialize default statistics
+        await conn.executemany(
+            "INSERT OR IGNORE INTO statistics VALUES (?, '0')",
+            [('total_vps_created',), ('total_restarts',), ('total_downloads',)]
         )
-    """)
-    
-    # Initialize default statistics
-    cursor.execute("INSERT OR IGNORE INTO statistics VALUES ('total_vps_created', '0')")
-    cursor.execute("INSERT OR IGNORE INTO statistics VALUES ('total_restarts', '0')")
-    cursor.execute("INSERT OR IGNORE INTO statistics VALUES ('total_downloads', '0')")
+        
+        await conn.commit()
     
-    conn.commit()
-    conn.close()
+    await load_statistics()
     logger.info("✅ Database initialized successfully")
 
+# In-memory mirror of the statistics table. The bot is the only writer, so
+# it is loaded once at startup and bumped alongside every UPDATE.
+STATS: Dict[str, int] = {}
+
+async def load_statistics():
+    """Load the statistics counters into STATS"""
+    rows = await db_pool.fetchall(SQL_GET_STATS)
+    STATS.update((key, int(value)) for key, value in rows)
+
+def _bump_stat_mirror(key: str):
+    """Apply a committed counter increment to STATS"""
+    STATS[key] = STATS.get(key, 0) + 1
+
+async def increment_stat(key: str):
+    """Increment a statistics counter in the database and in STATS"""
+    await db_pool.execute(SQL_INCREMENT_STAT, (key,))
+    _bump_stat_mirror(key)
+
+PASSWORD_CHARS = (string.ascii_letters + string.digits + "!@#$%^&*").encode()
+# Largest multiple of len(PASSWORD_CHARS) that fits in a byte; bytes at or
+# above it are rejected so every character stays equally likely
+_PASSWORD_BYTE_LIMIT = 256 - (256 % len(PASSWORD_CHARS))
+
 def generate_vps_id() -> str:
     """Generate unique VPS ID"""
-    return f"vps_{secrets.token_hex(8)}"
+    return f"vps_{os.urandom(8).hex()}"
 
 def generate_password(length: int = 16) -> str:
     """Generate secure random password"""
-    chars = string.ascii_letters + string.digits + "!@#$%^&*"
-    return ''.join(secrets.choice(chars) for _ in range(length))
+    password = bytearray()
+    while len(password) < length:
+        # One urandom read per 64 candidate bytes instead of one per character
+        for byte in os.urandom(64):
+            if byte < _PASSWORD_BYTE_LIMIT:
+                password.append(PASSWORD_CHARS[byte % len(PASSWORD_CHARS)])
+                if len(password) == length:
+                    break
+    return password.decode()
 
 # ============================================
 # 🔐 PERMISSION CHECKS
 # ============================================
 
+PERMISSION_CACHE_TTL = 60  # seconds
+
+def async_ttl_cache(maxsize: int = 1024, ttl: float = PERMISSION_CACHE_TTL):
+    """Cache results of a single-argument coroutine function for ``ttl`` seconds.
+
+    The wrapped function gains ``invalidate(key)`` and ``cache_clear()``.
+    """
+    def decorator(func):
+        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        
+        @functools.wraps(func)
+        async def wrapper(key):
+            try:
+                return cache[key]
+            except KeyError:
+                pass
+            value = await func(key)
+            cache[key] = value
+            return value
+        
+        wrapper.invalidate = lambda key: cache.pop(key, None)
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
 def is_owner(user_id: int) -> bool:
     """Check if user is bot owner"""
     return user_id == OWNER_ID
 
-def is_admin(user_id: int) -> bool:
+@async_ttl_cache()
+async def is_admin(user_id: int) -> bool:
     """Check if user is admin"""
     if is_owner(user_id):
         return True
     
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute("SELECT user_id FROM admins WHERE user_id = ?", (user_id,))
-    result = cursor.fetchone()
-    conn.close()
+    result = await db_pool.fetchone(SQL_IS_ADMIN, (user_id,))
     return result is not None
 
 def has_admin_role(member: discord.Member) -> bool:
@@ -222,25 +488,69 @@ def has_admin_role(member: discord.Member) -> bool:
         return False
     return any(role.id == ADMIN_ROLE_ID for role in member.roles)
 
-def is_banned(user_id: int) -> bool:
+# Permission flags, so command gates reduce to a single bit test
+PERM_OWNER = 1 << 0
+PERM_ADMIN = 1 << 1
+
+# Only the owner/admins-table flags are cached. The admin role depends on
+# how the user was resolved (Member in a guild, plain User in DMs) and can
+# change at any time, so it is checked live on every call.
+_permission_cache = TTLCache(maxsize=4096, ttl=PERMISSION_CACHE_TTL)
+
+async def get_permissions(user: discord.abc.User) -> int:
+    """Return the PERM_* flags held by user"""
+    # The in-memory role scan is cheaper than the admins lookup, so try it first
+    if isinstance(user, discord.Member) and has_admin_role(user):
+        return PERM_ADMIN | (PERM_OWNER if is_owner(user.id) else 0)
+    try:
+        return _permission_cache[user.id]
+    except KeyError:
+        pass
+    flags = 0
+    if is_owner(user.id):
+        flags |= PERM_OWNER | PERM_ADMIN
+    elif await is_admin(user.id):
+        flags |= PERM_ADMIN
+    _permission_cache[user.id] = flags
+    return flags
+
+async def is_admin_user(user: discord.abc.User) -> bool:
+    """Check if user is an admin or holds the admin role"""
+    return bool(await get_permissions(user) & PERM_ADMIN)
+
+def invalidate_admin(user_id: int):
+    """Drop cached admin status after the admins table changes"""
+    is_admin.invalidate(user_id)
+    _permission_cache.pop(user_id, None)
+
+def require_admin(func):
+    """Reject the interaction unless the invoking user is an admin.
+
+    Apply below the ``app_commands`` decorators so the command keeps the
+    wrapped function's parameters.
+    """
+    @functools.wraps(func)
+    async def wrapper(interaction: discord.Interaction, *args, **kwargs):
+        if not await get_permissions(interaction.user) & PERM_ADMIN:
+            embed = create_error_embed("Access Denied", "❌ This command requires admin permissions!")
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+        return await func(interaction, *args, **kwargs)
+    return wrapper
+
+@async_ttl_cache()
+async def is_banned(user_id: int) -> bool:
     """Check if user is banned"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute("SELECT user_id FROM banned_users WHERE user_id = ?", (user_id,))
-    result = cursor.fetchone()
-    conn.close()
+    result = await db_pool.fetchone(SQL_IS_BANNED, (user_id,))
     return result is not None
 
-def can_create_vps(user_id: int) -> tuple[bool, str]:
+async def can_create_vps(user_id: int) -> tuple[bool, str]:
     """Check if user can create more VPS"""
-    if is_admin(user_id):
+    if await is_admin(user_id):
         return True, ""
     
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute("SELECT COUNT(*) FROM vps WHERE owner_id = ?", (user_id,))
-    count = cursor.fetchone()[0]
-    conn.close()
+    # Stop reading as soon as the limit is reached instead of counting every row
+    count = len(await db_pool.fetchall(SQL_USER_VPS_UP_TO, (user_id, MAX_VPS_PER_USER)))
     
     if count >= MAX_VPS_PER_USER:
         return False, f"You have reached the maximum limit of {MAX_VPS_PER_USER} VPS instances."
@@ -250,29 +560,94 @@ def can_create_vps(user_id: int) -> tuple[bool, str]:
 # 📥 ASYNC DOWNLOAD FUNCTION
 # ============================================
 
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # 8MB chunks
+DOWNLOAD_PROGRESS_STEP = 5.0  # Minimum progress (%) between callback invocations
+
+# Shared HTTP session so image downloads reuse pooled keep-alive connections
+HTTP_SESSION: Optional[aiohttp.ClientSession] = None
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Return the shared HTTP session, creating it on first use"""
+    global HTTP_SESSION
+    if HTTP_SESSION is None or HTTP_SESSION.closed:
+        connector = aiohttp.TCPConnector(limit=8, ttl_dns_cache=300, keepalive_timeout=60)
+        HTTP_SESSION = aiohttp.ClientSession(connector=connector)
+    return HTTP_SESSION
+
+async def close_http_session():
+    """Close the shared HTTP session"""
+    global HTTP_SESSION
+    if HTTP_SESSION is not None and not HTTP_SESSION.closed:
+        await HTTP_SESSION.close()
+    HTTP_SESSION = None
+
+async def _probe_remote_image(session: aiohttp.ClientSession, url: str) -> Tuple[int, Optional[float]]:
+    """Return (content length, last-modified timestamp) of a remote file via HEAD"""
+    try:
+        async with session.head(url, allow_redirects=True) as response:
+            if response.status != 200:
+                return 0, None
+            size = int(response.headers.get('content-length', 0))
+            last_modified = response.headers.get('last-modified')
+            return size, parsedate_to_datetime(last_modified).timestamp() if last_modified else None
+    except Exception as e:
+        logger.warning(f"⚠️ HEAD request failed for {url}: {str(e)}")
+        return 0, None
+
 async def download_image_async(url: str, output_path: str, callback=None) -> bool:
-    """Download image file asynchronously with progress tracking"""
+    """Download image file asynchronously with progress tracking.
+
+    Data is streamed into ``<output_path>.part`` and only renamed to
+    ``output_path`` once complete, so an interrupted download is resumed
+    with a Range request instead of starting over.
+    """
+    part_path = f"{output_path}.part"
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status != 200:
+        session = get_http_session()
+        remote_size, remote_mtime = 0, None
+        
+        existing = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        if existing:
+            # Partial data is only reusable if the remote image hasn't changed since
+            remote_size, remote_mtime = await _probe_remote_image(session, url)
+            stale = remote_mtime is not None and remote_mtime > os.path.getmtime(part_path)
+            if stale or (remote_size and existing > remote_size):
+                existing = 0
+        
+        if remote_size and existing == remote_size:
+            logger.info(f"✅ Partial download already complete: {part_path}")
+        else:
+            headers = {'Range': f'bytes={existing}-'} if existing else {}
+            async with session.get(url, headers=headers) as response:
+                if response.status == 206:
+                    mode = 'ab'
+                    logger.info(f"📥 Resuming download at {existing / 1024 / 1024:.1f}MB")
+                elif response.status == 200:
+                    mode = 'wb'
+                    existing = 0
+                else:
                     logger.error(f"Failed to download image: HTTP {response.status}")
                     return False
                 
-                total_size = int(response.headers.get('content-length', 0))
-                downloaded = 0
+                total_size = existing + int(response.headers.get('content-length', 0))
+                downloaded = existing
+                last_reported = 0.0
                 
-                async with aiofiles.open(output_path, 'wb') as f:
-                    async for chunk in response.content.iter_chunked(1024 * 1024):  # 1MB chunks
+                async with aiofiles.open(part_path, mode) as f:
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
                         await f.write(chunk)
                         downloaded += len(chunk)
                         
                         if callback and total_size > 0:
                             progress = (downloaded / total_size) * 100
-                            await callback(progress)
-                
-                logger.info(f"✅ Downloaded image: {output_path}")
-                return True
+                            # Throttle callbacks (e.g. Discord message edits)
+                            if progress - last_reported >= DOWNLOAD_PROGRESS_STEP or downloaded >= total_size:
+                                last_reported = progress
+                                await callback(progress)
+        
+        os.replace(part_path, output_path)
+        logger.info(f"✅ Downloaded image: {output_path}")
+        return True
     except Exception as e:
         logger.error(f"❌ Download failed: {str(e)}")
         return False
@@ -281,55 +656,11 @@ async def download_image_async(url: str, output_path: str, callback=None) -> boo
 # 🖥️ VPS MANAGEMENT FUNCTIONS
 # ============================================
 
-async def create_vps_instance(
-    owner_id: int,
-    memory: int,
-    cpus: int,
-    disk_size: str,
-    hostname: str,
-    username: str,
-    password: str,
-    os_type: str = "ubuntu22",
-    gui_mode: bool = False,
-    port_forwards: str = ""
-) -> Dict:
-    """Create a new VPS instance asynchronously"""
-    
-    vps_id = generate_vps_id()
-    ssh_port = await find_free_port()
-    
-    # Get OS configuration
-    os_config = OS_IMAGES.get(os_type, OS_IMAGES["ubuntu22"])
-    
-    # File paths
-    img_file = f"{VM_DIR}/{vps_id}.img"
-    seed_file = f"{VM_DIR}/{vps_id}-seed.iso"
-    
-    # Check if we need to download
-    cache_file = f"{VM_DIR}/cache_{os_type}.img"
-    
-    if not os.path.exists(cache_file):
-        logger.info(f"📥 Downloading {os_config['name']}...")
-        success = await download_image_async(os_config["image"], cache_file)
-        if not success:
-            raise Exception("Failed to download OS image")
-        
-        # Update statistics
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-        cursor.execute("UPDATE statistics SET value = CAST(value AS INTEGER) + 1 WHERE key = 'total_downloads'")
-        conn.commit()
-        conn.close()
-    
-    # Copy cached image to VPS image
-    logger.info(f"📋 Creating VPS image from cache...")
-    process = await asyncio.create_subprocess_exec(
-        'cp', cache_file, img_file,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE
-    )
-    await process.communicate()
-    
+# One lock per OS type so only one coroutine downloads a given cache image
+_download_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+async def resize_disk_image(img_file: str, disk_size: str):
+    """Grow a VPS disk image to the requested size (never shrinks)"""
     # Get current disk size
     process = await asyncio.create_subprocess_exec(
         'qemu-img', 'info', '--output=json', img_file,
@@ -339,8 +670,7 @@ async def create_vps_instance(
     stdout, stderr = await process.communicate()
     
     if process.returncode == 0:
-        import json
-        info = json.loads(stdout.decode())
+        info = orjson.loads(stdout)
         current_size = info.get('virtual-size', 0)
         
         # Parse target size (convert G to bytes)
@@ -368,6 +698,72 @@ async def create_vps_instance(
             logger.info(f"💾 Disk size {disk_size} is equal or smaller than current size, skipping resize")
     else:
         logger.warning(f"⚠️ Could not get image info: {stderr.decode()}")
+
+async def write_text_file(path: str, content: str):
+    """Write a text file asynchronously"""
+    async with aiofiles.open(path, "w") as f:
+        await f.write(content)
+
+async def ensure_cached_image(os_type: str, os_config: Dict, cache_file: str) -> bool:
+    """Download the base image for an OS if needed, returning True if fetched"""
+    if os.path.exists(cache_file):
+        return False
+    
+    # Concurrent creations of the same OS share a single download
+    async with _download_locks[os_type]:
+        if os.path.exists(cache_file):
+            return False
+        logger.info(f"📥 Downloading {os_config['name']}...")
+        success = await download_image_async(os_config["image"], cache_file)
+        if not success:
+            raise Exception("Failed to download OS image")
+        return True
+
+async def create_vps_instance(
+    owner_id: int,
+    memory: int,
+    cpus: int,
+    disk_size: str,
+    hostname: str,
+    username: str,
+    password: str,
+    os_type: str = "ubuntu22",
+    gui_mode: bool = False,
+    port_forwards: str = ""
+) -> Dict:
+    """Create a new VPS instance asynchronously"""
+    
+    vps_id = generate_vps_id()
+    
+    # Get OS configuration
+    os_config = OS_IMAGES.get(os_type, OS_IMAGES["ubuntu22"])
+    
+    # File paths
+    img_file = f"{VM_DIR}/{vps_id}.img"
+    seed_file = f"{VM_DIR}/{vps_id}-seed.iso"
+    cache_file = f"{VM_DIR}/cache_{os_type}.img"
+    
+    # Allocate the SSH port while the base image is fetched
+    ssh_port, image_downloaded = await asyncio.gather(
+        find_free_port(),
+        ensure_cached_image(os_type, os_config, cache_file)
+    )
+    
+    # Create a copy-on-write overlay backed by the cached image. The cache
+    # file must never be modified or deleted while VPS images reference it.
+    # The backing path is made absolute since qemu-img resolves relative
+    # paths against the overlay's directory.
+    logger.info(f"📋 Creating VPS image from cache...")
+    process = await asyncio.create_subprocess_exec(
+        'qemu-img', 'create', '-f', 'qcow2', '-F', 'qcow2',
+        '-b', os.path.abspath(cache_file), img_file,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await process.communicate()
+    
+    if process.returncode != 0:
+        raise Exception(f"Failed to create VPS image: {stderr.decode()}")
     
     # Create cloud-init config
     user_data = f"""#cloud-config
@@ -401,11 +797,12 @@ runcmd:
 local-hostname: {hostname}
 """
     
-    # Write cloud-init files
-    async with aiofiles.open(f"{VM_DIR}/user-data-{vps_id}", "w") as f:
-        await f.write(user_data)
-    async with aiofiles.open(f"{VM_DIR}/meta-data-{vps_id}", "w") as f:
-        await f.write(meta_data)
+    # Write cloud-init files while the disk is inspected/resized
+    await asyncio.gather(
+        resize_disk_image(img_file, disk_size),
+        write_text_file(f"{VM_DIR}/user-data-{vps_id}", user_data),
+        write_text_file(f"{VM_DIR}/meta-data-{vps_id}", meta_data)
+    )
     
     # Create seed ISO
     logger.info(f"💿 Creating cloud-init ISO...")
@@ -421,22 +818,25 @@ local-hostname: {hostname}
     if process.returncode != 0:
         raise Exception(f"Failed to create seed ISO: {stderr.decode()}")
     
-    # Save to database
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO vps (vps_id, owner_id, hostname, username, password, ssh_port,
-                        memory, cpus, disk_size, os_type, image_file, seed_file,
-                        gui_mode, port_forwards)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (vps_id, owner_id, hostname, username, password, ssh_port, memory, cpus,
-          disk_size, os_type, img_file, seed_file, 1 if gui_mode else 0, port_forwards))
-    
-    # Update statistics
-    cursor.execute("UPDATE statistics SET value = CAST(value AS INTEGER) + 1 WHERE key = 'total_vps_created'")
+    qemu_cmd = build_qemu_command(
+        vps_id, memory, cpus, ssh_port, img_file, seed_file, gui_mode, port_forwards
+    )
     
-    conn.commit()
-    conn.close()
+    # Save to database and update statistics in one transaction (single fsync)
+    async with db_pool.transaction() as conn:
+        await conn.execute(SQL_INSERT_VPS, (
+            vps_id, owner_id, hostname, username, password, ssh_port, memory, cpus,
+            disk_size, os_type, img_file, seed_file, 1 if gui_mode else 0, port_forwards,
+            int(time.time()), json.dumps(qemu_cmd)
+        ))
+        if image_downloaded:
+            await conn.execute(SQL_INCREMENT_STAT, ('total_downloads',))
+        await conn.execute(SQL_INCREMENT_STAT, ('total_vps_created',))
+    
+    # Mirror the committed counters
+    if image_downloaded:
+        _bump_stat_mirror('total_downloads')
+    _bump_stat_mirror('total_vps_created')
     
     # Cleanup temp files
     try:
@@ -456,54 +856,45 @@ local-hostname: {hostname}
         "os_type": os_type
     }
 
-async def start_vps(vps_id: str) -> bool:
-    """Start a VPS instance"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM vps WHERE vps_id = ?", (vps_id,))
-    vps = cursor.fetchone()
-    conn.close()
-    
-    if not vps:
-        logger.error(f"VPS {vps_id} not found in database")
-        return False
-    
-    # Check if image files exist
-    if not os.path.exists(vps[11]):
-        logger.error(f"Image file not found: {vps[11]}")
-        return False
-    
-    if not os.path.exists(vps[12]):
-        logger.error(f"Seed file not found: {vps[12]}")
-        return False
-    
-    # Build QEMU command
-    pidfile = f"{VM_DIR}/{vps_id}.pid"
+def build_qemu_command(
+    vps_id: str,
+    memory: int,
+    cpus: int,
+    ssh_port: int,
+    image_file: str,
+    seed_file: str,
+    gui_mode: bool,
+    port_forwards: Optional[str]
+) -> List[str]:
+    """Build the QEMU argv for a VPS (without the -pidfile argument).
+
+    The result is stored in the vps.qemu_cmd column at creation time, so any
+    future command that edits these settings must store a rebuilt command.
+    """
     logfile = f"{VM_DIR}/{vps_id}.log"
     
     cmd = [
         "qemu-system-x86_64",
         "-enable-kvm",
-        "-m", str(vps[7]),  # memory
-        "-smp", str(vps[8]),  # cpus
+        "-m", str(memory),
+        "-smp", str(cpus),
         "-cpu", "host",
-        "-drive", f"file={vps[11]},format=qcow2,if=virtio",
-        "-drive", f"file={vps[12]},format=raw,if=virtio",
+        "-drive", f"file={image_file},format=qcow2,if=virtio",
+        "-drive", f"file={seed_file},format=raw,if=virtio",
         "-boot", "order=c",
         "-device", "virtio-net-pci,netdev=n0",
-        "-netdev", f"user,id=n0,hostfwd=tcp::{vps[6]}-:22",
-        "-daemonize",
-        "-pidfile", pidfile
+        "-netdev", f"user,id=n0,hostfwd=tcp::{ssh_port}-:22",
+        "-daemonize"
     ]
     
-    if vps[16]:  # gui_mode
+    if gui_mode:
         cmd.extend(["-vga", "virtio", "-display", "gtk,gl=on"])
     else:
         cmd.extend(["-nographic", "-serial", f"file:{logfile}"])
     
     # Add port forwards
-    if vps[17]:
-        forwards = vps[17].split(',')
+    if port_forwards:
+        forwards = port_forwards.split(',')
         for i, forward in enumerate(forwards, 1):
             if ':' in forward:
                 try:
@@ -515,6 +906,39 @@ async def start_vps(vps_id: str) -> bool:
                 except ValueError:
                     logger.warning(f"Invalid port forward format: {forward}")
     
+    return cmd
+
+async def start_vps(vps_id: str) -> bool:
+    """Start a VPS instance"""
+    vps = await get_vps_by_id(vps_id)
+    
+    if not vps:
+        logger.error(f"VPS {vps_id} not found in database")
+        return False
+    
+    # Check if image files exist
+    if not os.path.exists(vps.image_file):
+        logger.error(f"Image file not found: {vps.image_file}")
+        return False
+    
+    if not os.path.exists(vps.seed_file):
+        logger.error(f"Seed file not found: {vps.seed_file}")
+        return False
+    
+    # Use the argv precomputed at creation; older rows get it built once and stored
+    if vps.qemu_cmd:
+        cmd = json.loads(vps.qemu_cmd)
+    else:
+        cmd = build_qemu_command(
+            vps_id, vps.memory, vps.cpus, vps.ssh_port, vps.image_file,
+            vps.seed_file, bool(vps.gui_mode), vps.port_forwards
+        )
+        await db_pool.execute(SQL_SET_VPS_QEMU_CMD, (json.dumps(cmd), vps_id))
+        get_vps_by_id.invalidate(vps_id)
+    
+    pidfile = f"{VM_DIR}/{vps_id}.pid"
+    cmd.extend(["-pidfile", pidfile])
+    
     # Start QEMU
     try:
         logger.info(f"Starting QEMU with command: {' '.join(cmd)}")
@@ -572,11 +996,8 @@ async def start_vps(vps_id: str) -> bool:
             return False
         
         # Update database
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-        cursor.execute("UPDATE vps SET status = 'running', pid = ? WHERE vps_id = ?", (pid, vps_id))
-        conn.commit()
-        conn.close()
+        await db_pool.execute(SQL_SET_VPS_RUNNING, (pid, vps_id))
+        get_vps_by_id.invalidate(vps_id)
         
         logger.info(f"✅ VPS {vps_id} started successfully (PID: {pid})")
         return True
@@ -592,13 +1013,9 @@ async def start_vps(vps_id: str) -> bool:
 
 async def stop_vps(vps_id: str) -> bool:
     """Stop a VPS instance"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute("SELECT pid FROM vps WHERE vps_id = ?", (vps_id,))
-    result = cursor.fetchone()
+    result = await db_pool.fetchone(SQL_GET_VPS_PID, (vps_id,))
     
     if not result or not result[0]:
-        conn.close()
         return False
     
     pid = result[0]
@@ -616,21 +1033,37 @@ async def stop_vps(vps_id: str) -> bool:
             pass
         
         # Update database
-        cursor.execute("UPDATE vps SET status = 'stopped', pid = NULL WHERE vps_id = ?", (vps_id,))
-        conn.commit()
-        conn.close()
+        await db_pool.execute(SQL_SET_VPS_STOPPED, (vps_id,))
+        get_vps_by_id.invalidate(vps_id)
         
         logger.info(f"✅ VPS {vps_id} stopped")
         return True
     except Exception as e:
         logger.error(f"❌ Failed to stop VPS {vps_id}: {str(e)}")
-        conn.close()
         return False
 
+def _read_used_ports() -> bytearray:
+    """Build a bitmap of local TCP ports in use from /proc/net/tcp{,6}"""
+    bitmap = bytearray(65536 // 8)
+    for path in ('/proc/net/tcp', '/proc/net/tcp6'):
+        try:
+            with open(path) as f:
+                next(f, None)  # header
+                for line in f:
+                    port = int(line.split()[1].rsplit(':', 1)[1], 16)
+                    bitmap[port >> 3] |= 1 << (port & 7)
+        except (OSError, ValueError, IndexError):
+            continue
+    return bitmap
+
 async def find_free_port(start: int = 2222, end: int = 65535) -> int:
     """Find a free port for SSH"""
     import socket
+    used = await asyncio.to_thread(_read_used_ports)
     for port in range(start, end):
+        if used[port >> 3] & (1 << (port & 7)):
+            continue
+        # Confirm with a real bind in case the port was taken since the scan
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
             try:
                 s.bind(('', port))
@@ -639,41 +1072,74 @@ async def find_free_port(start: int = 2222, end: int = 65535) -> int:
                 continue
     return 2222
 
-def get_user_vps(user_id: int) -> List[tuple]:
+def _remove_files(*paths: str):
+    """Remove files, ignoring any that don't exist"""
+    for path in paths:
+        Path(path).unlink(missing_ok=True)
+
+LOG_TAIL_BYTES = 64 * 1024  # Only the end of the log is read for /vps_logs
+
+def _tail_sync(path: str, lines: int) -> str:
+    """Return the last ``lines`` lines of a file"""
+    if lines <= 0:
+        return ""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - LOG_TAIL_BYTES))
+        data = f.read()
+    return b'\n'.join(data.splitlines()[-lines:]).decode('utf-8', 'replace')
+
+async def tail_file(path: str, lines: int) -> str:
+    """Return the last ``lines`` lines of a file without blocking the event loop"""
+    return await asyncio.to_thread(_tail_sync, path, lines)
+
+async def get_user_vps(user_id: int) -> List[VPSSummary]:
     """Get all VPS owned by user"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
     if user_id == 0:
-        cursor.execute("SELECT * FROM vps")
+        rows = await db_pool.fetchall(SQL_GET_ALL_VPS)
     else:
-        cursor.execute("SELECT * FROM vps WHERE owner_id = ?", (user_id,))
-    vps_list = cursor.fetchall()
-    conn.close()
-    return vps_list
+        rows = await db_pool.fetchall(SQL_GET_USER_VPS, (user_id,))
+    return [VPSSummary._make(row) for row in rows]
 
-def get_vps_by_id(vps_id: str) -> Optional[tuple]:
+VPS_CACHE_TTL = 5  # seconds; writes to a VPS row invalidate its entry
+
+@async_ttl_cache(maxsize=4096, ttl=VPS_CACHE_TTL)
+async def get_vps_by_id(vps_id: str) -> Optional[VPSRecord]:
     """Get VPS by ID"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM vps WHERE vps_id = ?", (vps_id,))
-    vps = cursor.fetchone()
-    conn.close()
-    return vps
+    row = await db_pool.fetchone(SQL_GET_VPS_BY_ID, (vps_id,))
+    return VPSRecord._make(row) if row else None
 
 # ============================================
 # 🎨 EMBED BUILDERS
 # ============================================
 
+EMBED_FOOTER_TEXT = "🚀 HOPINGBOYZ VPS Manager"
+
+# Embed timestamps only need second-level accuracy, so one aware datetime
+# is shared across all embeds built within the same half second
+UTCNOW_MAX_AGE = 0.5  # seconds
+_utcnow_checked = 0.0
+_utcnow_value: Optional[datetime] = None
+
+def utcnow() -> datetime:
+    """Current UTC time, refreshed at most every UTCNOW_MAX_AGE seconds"""
+    global _utcnow_checked, _utcnow_value
+    now = time.monotonic()
+    if _utcnow_value is None or now - _utcnow_checked > UTCNOW_MAX_AGE:
+        _utcnow_value = datetime.now(timezone.utc)
+        _utcnow_checked = now
+    return _utcnow_value
+
 def create_success_embed(title: str, description: str) -> discord.Embed:
     """Create success embed"""
     embed = discord.Embed(
         title=f"✅ {title}",
         description=description,
         color=discord.Color.green(),
-        timestamp=datetime.now(timezone.utc)
+        timestamp=utcnow()
     )
     embed.set_footer(
-        text="🚀 HOPINGBOYZ VPS Manager",
+        text=EMBED_FOOTER_TEXT,
         icon_url="https://cdn.discordapp.com/emojis/1234567890.png" if bot.user and bot.user.avatar else None
     )
     return embed
@@ -684,9 +1150,9 @@ def create_error_embed(title: str, description: str) -> discord.Embed:
         title=f"❌ {title}",
         description=description,
         color=discord.Color.red(),
-        timestamp=datetime.now(timezone.utc)
+        timestamp=utcnow()
     )
-    embed.set_footer(text="🚀 HOPINGBOYZ VPS Manager")
+    embed.set_footer(text=EMBED_FOOTER_TEXT)
     return embed
 
 def create_info_embed(title: str, description: str) -> discord.Embed:
@@ -695,9 +1161,9 @@ def create_info_embed(title: str, description: str) -> discord.Embed:
         title=f"ℹ️ {title}",
         description=description,
         color=discord.Color.blue(),
-        timestamp=datetime.now(timezone.utc)
+        timestamp=utcnow()
     )
-    embed.set_footer(text="🚀 HOPINGBOYZ VPS Manager")
+    embed.set_footer(text=EMBED_FOOTER_TEXT)
     return embed
 
 def create_warning_embed(title: str, description: str) -> discord.Embed:
@@ -706,26 +1172,26 @@ def create_warning_embed(title: str, description: str) -> discord.Embed:
         title=f"⚠️ {title}",
         description=description,
         color=discord.Color.orange(),
-        timestamp=datetime.now(timezone.utc)
+        timestamp=utcnow()
     )
-    embed.set_footer(text="🚀 HOPINGBOYZ VPS Manager")
+    embed.set_footer(text=EMBED_FOOTER_TEXT)
     return embed
 
-def create_vps_info_embed(vps: tuple) -> discord.Embed:
+def create_vps_info_embed(vps: VPSRecord) -> discord.Embed:
     """Create VPS info embed"""
-    os_name = OS_IMAGES.get(vps[10], {}).get("name", vps[10])
-    status_emoji = "🟢" if vps[13] == "running" else "🔴"
+    os_name = OS_NAME_BY_KEY.get(vps.os_type, vps.os_type)
+    status_emoji = "🟢" if vps.status == "running" else "🔴"
     
     embed = discord.Embed(
         title=f"🖥️ VPS Information",
-        description=f"**{vps[3]}** (`{vps[1]}`)",
-        color=discord.Color.blue() if vps[13] == "running" else discord.Color.greyple(),
-        timestamp=datetime.now(timezone.utc)
+        description=f"**{vps.hostname}** (`{vps.vps_id}`)",
+        color=discord.Color.blue() if vps.status == "running" else discord.Color.greyple(),
+        timestamp=utcnow()
     )
     
     embed.add_field(
         name="📊 Status",
-        value=f"{status_emoji} **{vps[13].upper()}**",
+        value=f"{status_emoji} **{vps.status.upper()}**",
         inline=True
     )
     embed.add_field(
@@ -735,59 +1201,78 @@ def create_vps_info_embed(vps: tuple) -> discord.Embed:
     )
     embed.add_field(
         name="🆔 VPS ID",
-        value=f"`{vps[1]}`",
+        value=f"`{vps.vps_id}`",
         inline=True
     )
     
     embed.add_field(
         name="👤 Username",
-        value=f"`{vps[4]}`",
+        value=f"`{vps.username}`",
         inline=True
     )
     embed.add_field(
         name="🔑 Password",
-        value=f"||`{vps[5]}`||",
+        value=f"||`{vps.password}`||",
         inline=True
     )
     embed.add_field(
         name="🔌 SSH Port",
-        value=f"`{vps[6]}`",
+        value=f"`{vps.ssh_port}`",
         inline=True
     )
     
     embed.add_field(
         name="🧠 Memory",
-        value=f"`{vps[7]} MB`",
+        value=f"`{vps.memory} MB`",
         inline=True
     )
     embed.add_field(
         name="⚡ CPU Cores",
-        value=f"`{vps[8]}`",
+        value=f"`{vps.cpus}`",
         inline=True
     )
     embed.add_field(
         name="💾 Disk Size",
-        value=f"`{vps[9]}`",
+        value=f"`{vps.disk_size}`",
         inline=True
     )
     
-    created_ts = int(datetime.fromisoformat(vps[15]).timestamp())
+    created_ts = vps.created_ts
     embed.add_field(
         name="📅 Created",
         value=f"<t:{created_ts}:R>",
         inline=False
     )
     
-    if vps[13] == "running":
+    if vps.status == "running":
         embed.add_field(
             name="🔗 SSH Connection",
-            value=f"```bash\nssh -p {vps[6]} {vps[4]}@{DEFAULT_HOSTNAME}```",
+            value=f"```bash\n{vps.ssh_command}```",
             inline=False
         )
     
-    embed.set_footer(text="🚀 HOPINGBOYZ VPS Manager")
+    embed.set_footer(text=EMBED_FOOTER_TEXT)
     return embed
 
+class ConfirmView(discord.ui.View):
+    """Confirm/cancel buttons for destructive actions"""
+    
+    def __init__(self):
+        super().__init__(timeout=60)
+        self.value = None
+    
+    @discord.ui.button(label="✅ Confirm Delete", style=discord.ButtonStyle.danger)
+    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.value = True
+        await interaction.response.defer()
+        self.stop()
+    
+    @discord.ui.button(label="❌ Cancel", style=discord.ButtonStyle.secondary)
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.value = False
+        await interaction.response.defer()
+        self.stop()
+
 # ============================================
 # 📱 BOT EVENTS
 # ============================================
@@ -807,7 +1292,11 @@ async def on_ready():
     logger.info("✅ Status: ONLINE")
     logger.info("=" * 70)
     
-    init_database()
+    await db_pool.open()
+    await init_database()
+    get_http_session()
+    # Prime psutil's CPU counters so /admin_stats can read usage without sleeping
+    psutil.cpu_percent(interval=None)
     
     try:
         await bot.tree.sync()
@@ -824,17 +1313,35 @@ async def on_command_error(ctx, error):
         return
     logger.error(f"Command error: {str(error)}")
 
+def _find_dead_vps(rows: List[tuple]) -> List[str]:
+    """Return IDs of VPS whose recorded QEMU process no longer exists"""
+    if not os.path.isdir('/proc'):
+        return []
+    return [vps_id for vps_id, pid in rows if not pid or not os.path.exists(f"/proc/{pid}")]
+
+# (running, total) shown in the last presence update
+_last_presence_counts: Optional[tuple] = None
+
 @tasks.loop(seconds=30)
 async def status_updater():
-    """Update bot status"""
+    """Update bot status and reconcile stale VPS state"""
+    global _last_presence_counts
     try:
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM vps WHERE status = 'running'")
-        running = cursor.fetchone()[0]
-        cursor.execute("SELECT COUNT(*) FROM vps")
-        total = cursor.fetchone()[0]
-        conn.close()
+        # Mark VPS whose process died as stopped, in a single transaction
+        running_rows = await db_pool.fetchall(SQL_GET_RUNNING_PIDS)
+        dead = await asyncio.to_thread(_find_dead_vps, running_rows)
+        if dead:
+            async with db_pool.transaction() as conn:
+                await conn.executemany(SQL_SET_VPS_STOPPED, [(vps_id,) for vps_id in dead])
+            for vps_id in dead:
+                get_vps_by_id.invalidate(vps_id)
+            logger.info(f"🔄 Marked {len(dead)} VPS as stopped (process no longer running)")
+        
+        running, total = await db_pool.fetchone(SQL_VPS_COUNTS)
+        
+        # change_presence is a rate-limited gateway write; skip it if nothing changed
+        if (running, total) == _last_presence_counts:
+            return
         
         await bot.change_presence(
             activity=discord.Activity(
@@ -843,6 +1350,7 @@ async def status_updater():
             ),
             status=discord.Status.online
         )
+        _last_presence_counts = (running, total)
     except Exception as e:
         logger.error(f"Status update error: {str(e)}")
 
@@ -850,18 +1358,45 @@ async def status_updater():
 # 💬 SLASH COMMANDS - USER
 # ============================================
 
-@bot.tree.command(name="help", description="📚 Show all available commands")
-async def help_command(interaction: discord.Interaction):
-    """Display help information"""
+# Shared rejection embeds, copied per use so only the timestamp and ID change
+_EMBED_NOT_FOUND = create_error_embed("VPS Not Found", "❌ No VPS exists with that ID.")
+_EMBED_DENIED = create_error_embed("Access Denied", "🔒 You don't own this VPS!")
+
+def vps_not_found_embed(vps_id: str) -> discord.Embed:
+    """Error embed for an unknown VPS ID"""
+    embed = _EMBED_NOT_FOUND.copy()
+    embed.timestamp = utcnow()
+    embed.add_field(name="🆔 VPS ID", value=f"`{vps_id}`", inline=False)
+    return embed
+
+def vps_denied_embed() -> discord.Embed:
+    """Error embed for a VPS owned by someone else"""
+    embed = _EMBED_DENIED.copy()
+    embed.timestamp = utcnow()
+    return embed
+
+async def _resolve_vps(interaction: discord.Interaction, vps_id: str) -> Optional[VPSRecord]:
+    """Look up a VPS the caller may manage, replying with an error if not"""
+    vps = await get_vps_by_id(vps_id)
+    
+    if not vps:
+        await interaction.response.send_message(embed=vps_not_found_embed(vps_id), ephemeral=True)
+        return None
+    
+    if vps.owner_id != interaction.user.id and not await is_admin(interaction.user.id):
+        await interaction.response.send_message(embed=vps_denied_embed(), ephemeral=True)
+        return None
+    
+    return vps
+
+def _build_help_embed(include_admin: bool) -> discord.Embed:
+    """Build the static part of the /help embed"""
     embed = discord.Embed(
         title="📚 HOPINGBOYZ VPS Manager",
         description="```Professional Virtual Private Server Management Platform```",
-        color=discord.Color.blue(),
-        timestamp=datetime.now(timezone.utc)
+        color=discord.Color.blue()
     )
     
-    embed.set_thumbnail(url=bot.user.avatar.url if bot.user.avatar else None)
-    
     embed.add_field(
         name="👤 User Commands",
         value=(
@@ -882,7 +1417,7 @@ async def help_command(interaction: discord.Interaction):
         inline=False
     )
     
-    if is_admin(interaction.user.id) or (isinstance(interaction.user, discord.Member) and has_admin_role(interaction.user)):
+    if include_admin:
         embed.add_field(
             name="👑 Admin Commands",
             value=(
@@ -929,7 +1464,23 @@ async def help_command(interaction: discord.Interaction):
         inline=True
     )
     
-    embed.set_footer(text=f"🚀 HOPINGBOYZ VPS Manager | Max {MAX_VPS_PER_USER} VPS per user")
+    embed.set_footer(text=f"{EMBED_FOOTER_TEXT} | Max {MAX_VPS_PER_USER} VPS per user")
+    return embed
+
+# The help text never changes, so both variants are built once at import
+_HELP_EMBED_USER = _build_help_embed(include_admin=False)
+_HELP_EMBED_ADMIN = _build_help_embed(include_admin=True)
+
+@bot.tree.command(name="help", description="📚 Show all available commands")
+async def help_command(interaction: discord.Interaction):
+    """Display help information"""
+    if await is_admin_user(interaction.user):
+        embed = _HELP_EMBED_ADMIN.copy()
+    else:
+        embed = _HELP_EMBED_USER.copy()
+    
+    embed.timestamp = utcnow()
+    embed.set_thumbnail(url=bot.user.avatar.url if bot.user.avatar else None)
     await interaction.response.send_message(embed=embed, ephemeral=True)
 
 @bot.tree.command(name="create_vps", description="🚀 Create a new VPS instance")
@@ -959,7 +1510,7 @@ async def create_vps(
     """Create a new VPS instance"""
     
     # Check if banned
-    if is_banned(interaction.user.id):
+    if await is_banned(interaction.user.id):
         embed = create_error_embed(
             "Access Denied",
             "🚫 You are banned from creating VPS instances.\n\nContact an administrator for more information."
@@ -968,7 +1519,7 @@ async def create_vps(
         return
     
     # Check VPS limit
-    can_create, message = can_create_vps(interaction.user.id)
+    can_create, message = await can_create_vps(interaction.user.id)
     if not can_create:
         embed = create_error_embed("VPS Limit Reached", f"❌ {message}")
         await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -994,10 +1545,13 @@ async def create_vps(
     # Defer response
     await interaction.response.defer(thinking=True)
     
+    progress_task = None
     try:
         # Generate credentials
-        hostname = f"vps-{interaction.user.name.lower()}-{secrets.token_hex(3)}"
-        username = OS_IMAGES[os_type]["default_user"]
+        hostname = f"vps-{interaction.user.name.lower()}-{random.randbytes(3).hex()}"
+        os_meta = OS_IMAGES[os_type]
+        username = os_meta["default_user"]
+        os_name = os_meta["name"]
         password = generate_password()
         
         # Create progress embed
@@ -1006,14 +1560,15 @@ async def create_vps(
             f"⏳ Please wait while we set up your VPS\n\n"
             f"```yml\n"
             f"Hostname : {hostname}\n"
-            f"OS       : {OS_IMAGES[os_type]['name']}\n"
+            f"OS       : {os_name}\n"
             f"Memory   : {memory} MB\n"
             f"CPUs     : {cpus}\n"
             f"Disk     : {disk}\n"
             f"```\n"
             f"📥 Downloading OS image..."
         )
-        await interaction.followup.send(embed=progress_embed)
+        # Post the progress message while provisioning gets under way
+        progress_task = asyncio.create_task(interaction.followup.send(embed=progress_embed))
         
         # Create VPS
         vps_data = await create_vps_instance(
@@ -1026,6 +1581,10 @@ async def create_vps(
             password=password,
             os_type=os_type
         )
+        # The VPS exists now, so a failed progress message must not fail the command
+        progress_result, = await asyncio.gather(progress_task, return_exceptions=True)
+        if isinstance(progress_result, Exception):
+            logger.warning(f"⚠️ Failed to send VPS creation progress: {str(progress_result)}")
         
         # Success embed
         embed = create_success_embed(
@@ -1044,7 +1603,7 @@ async def create_vps(
             name="💻 System Specifications",
             value=(
                 f"```yml\n"
-                f"OS     : {OS_IMAGES[os_type]['name']}\n"
+                f"OS     : {os_name}\n"
                 f"Memory : {memory} MB\n"
                 f"CPUs   : {cpus} cores\n"
                 f"Disk   : {disk}\n"
@@ -1086,6 +1645,9 @@ async def create_vps(
         logger.info(f"✅ VPS created for user {interaction.user.id}: {vps_data['vps_id']}")
         
     except Exception as e:
+        if progress_task is not None:
+            # The progress message must land before it is replaced
+            await asyncio.gather(progress_task, return_exceptions=True)
         embed = create_error_embed(
             "VPS Creation Failed",
             f"❌ An error occurred while creating your VPS:\n\n```{str(e)}```\n\n"
@@ -1097,7 +1659,7 @@ async def create_vps(
 @bot.tree.command(name="list", description="📋 View all your VPS instances")
 async def list_vps(interaction: discord.Interaction):
     """List all VPS owned by user"""
-    vps_list = get_user_vps(interaction.user.id)
+    vps_list = await get_user_vps(interaction.user.id)
     
     if not vps_list:
         embed = create_info_embed(
@@ -1112,49 +1674,40 @@ async def list_vps(interaction: discord.Interaction):
         title=f"🖥️ Your VPS Instances",
         description=f"```Total: {len(vps_list)} VPS | Limit: {MAX_VPS_PER_USER}```",
         color=discord.Color.blue(),
-        timestamp=datetime.now(timezone.utc)
+        timestamp=utcnow()
     )
     
     for vps in vps_list:
-        status_emoji = "🟢" if vps[13] == "running" else "🔴"
-        os_name = OS_IMAGES.get(vps[10], {}).get("name", vps[10])
-        created_ts = int(datetime.fromisoformat(vps[15]).timestamp())
+        status_emoji = "🟢" if vps.status == "running" else "🔴"
+        os_name = OS_NAME_BY_KEY.get(vps.os_type, vps.os_type)
         
         value = (
-            f"{status_emoji} **Status:** `{vps[13].upper()}`\n"
+            f"{status_emoji} **Status:** `{vps.status.upper()}`\n"
             f"💻 **OS:** {os_name}\n"
-            f"🧠 **RAM:** `{vps[7]} MB` | ⚡ **CPU:** `{vps[8]}` | 💾 **Disk:** `{vps[9]}`\n"
-            f"🔌 **Port:** `{vps[6]}` | 📅 **Created:** <t:{created_ts}:R>\n"
-            f"🆔 **ID:** `{vps[1]}`"
+            f"🧠 **RAM:** `{vps.memory} MB` | ⚡ **CPU:** `{vps.cpus}` | 💾 **Disk:** `{vps.disk_size}`\n"
+            f"🔌 **Port:** `{vps.ssh_port}` | 📅 **Created:** <t:{vps.created_ts}:R>\n"
+            f"🆔 **ID:** `{vps.vps_id}`"
         )
         
         embed.add_field(
-            name=f"╔═ {vps[3]}",
+            name=f"╔═ {vps.hostname}",
             value=value,
             inline=False
         )
     
-    embed.set_footer(text="🚀 HOPINGBOYZ VPS Manager")
+    embed.set_footer(text=EMBED_FOOTER_TEXT)
     await interaction.response.send_message(embed=embed)
 
 @bot.tree.command(name="start_vps", description="▶️ Start a VPS instance")
 @app_commands.describe(vps_id="The ID of the VPS to start")
 async def start_vps_command(interaction: discord.Interaction, vps_id: str):
     """Start a VPS instance"""
-    vps = get_vps_by_id(vps_id)
-    
-    if not vps:
-        embed = create_error_embed("VPS Not Found", f"❌ No VPS found with ID: `{vps_id}`")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        return
-    
-    if vps[2] != interaction.user.id and not is_admin(interaction.user.id):
-        embed = create_error_embed("Access Denied", "🔒 You don't own this VPS!")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+    vps = await _resolve_vps(interaction, vps_id)
+    if vps is None:
         return
     
-    if vps[13] == "running":
-        embed = create_info_embed("Already Running", f"🟢 VPS **{vps[3]}** is already running!")
+    if vps.status == "running":
+        embed = create_info_embed("Already Running", f"🟢 VPS **{vps.hostname}** is already running!")
         await interaction.response.send_message(embed=embed, ephemeral=True)
         return
     
@@ -1162,7 +1715,7 @@ async def start_vps_command(interaction: discord.Interaction, vps_id: str):
     
     embed = create_info_embed(
         "Starting VPS...",
-        f"⏳ Booting up **{vps[3]}**\n\nThis may take a few moments..."
+        f"⏳ Booting up **{vps.hostname}**\n\nThis may take a few moments..."
     )
     await interaction.followup.send(embed=embed)
     
@@ -1171,21 +1724,21 @@ async def start_vps_command(interaction: discord.Interaction, vps_id: str):
     if success:
         embed = create_success_embed(
             "VPS Started Successfully!",
-            f"🟢 VPS **{vps[3]}** is now running!\n\n"
+            f"🟢 VPS **{vps.hostname}** is now running!\n\n"
             f"⏰ Wait **30-60 seconds** for the system to fully boot."
         )
         embed.add_field(
             name="🔗 SSH Connection",
-            value=f"```bash\nssh -p {vps[6]} {vps[4]}@{DEFAULT_HOSTNAME}```",
+            value=f"```bash\n{vps.ssh_command}```",
             inline=False
         )
-        embed.add_field(name="👤 Username", value=f"`{vps[4]}`", inline=True)
-        embed.add_field(name="🔑 Password", value=f"||`{vps[5]}`||", inline=True)
-        embed.add_field(name="🔌 SSH Port", value=f"`{vps[6]}`", inline=True)
+        embed.add_field(name="👤 Username", value=f"`{vps.username}`", inline=True)
+        embed.add_field(name="🔑 Password", value=f"||`{vps.password}`||", inline=True)
+        embed.add_field(name="🔌 SSH Port", value=f"`{vps.ssh_port}`", inline=True)
     else:
         embed = create_error_embed(
             "Failed to Start VPS",
-            f"❌ Could not start VPS **{vps[3]}**\n\n"
+            f"❌ Could not start VPS **{vps.hostname}**\n\n"
             f"Please check system logs or contact an administrator."
         )
     
@@ -1195,20 +1748,12 @@ async def start_vps_command(interaction: discord.Interaction, vps_id: str):
 @app_commands.describe(vps_id="The ID of the VPS to stop")
 async def stop_vps_command(interaction: discord.Interaction, vps_id: str):
     """Stop a VPS instance"""
-    vps = get_vps_by_id(vps_id)
-    
-    if not vps:
-        embed = create_error_embed("VPS Not Found", f"❌ No VPS found with ID: `{vps_id}`")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+    vps = await _resolve_vps(interaction, vps_id)
+    if vps is None:
         return
     
-    if vps[2] != interaction.user.id and not is_admin(interaction.user.id):
-        embed = create_error_embed("Access Denied", "🔒 You don't own this VPS!")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        return
-    
-    if vps[13] == "stopped":
-        embed = create_info_embed("Already Stopped", f"🔴 VPS **{vps[3]}** is already stopped!")
+    if vps.status == "stopped":
+        embed = create_info_embed("Already Stopped", f"🔴 VPS **{vps.hostname}** is already stopped!")
         await interaction.response.send_message(embed=embed, ephemeral=True)
         return
     
@@ -1219,13 +1764,13 @@ async def stop_vps_command(interaction: discord.Interaction, vps_id: str):
     if success:
         embed = create_success_embed(
             "VPS Stopped Successfully!",
-            f"🔴 VPS **{vps[3]}** has been shut down.\n\n"
+            f"🔴 VPS **{vps.hostname}** has been shut down.\n\n"
             f"Use `/start_vps {vps_id}` to boot it back up."
         )
     else:
         embed = create_error_embed(
             "Failed to Stop VPS",
-            f"❌ Could not stop VPS **{vps[3]}**\n\n"
+            f"❌ Could not stop VPS **{vps.hostname}**\n\n"
             f"Please contact an administrator."
         )
     
@@ -1235,56 +1780,45 @@ async def stop_vps_command(interaction: discord.Interaction, vps_id: str):
 @app_commands.describe(vps_id="The ID of the VPS to restart")
 async def restart_vps_command(interaction: discord.Interaction, vps_id: str):
     """Restart a VPS instance"""
-    vps = get_vps_by_id(vps_id)
-    
-    if not vps:
-        embed = create_error_embed("VPS Not Found", f"❌ No VPS found with ID: `{vps_id}`")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        return
-    
-    if vps[2] != interaction.user.id and not is_admin(interaction.user.id):
-        embed = create_error_embed("Access Denied", "🔒 You don't own this VPS!")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+    vps = await _resolve_vps(interaction, vps_id)
+    if vps is None:
         return
     
     await interaction.response.defer(thinking=True)
     
     embed = create_info_embed(
         "Restarting VPS...",
-        f"🔄 Restarting **{vps[3]}**\n\nPlease wait..."
+        f"🔄 Restarting **{vps.hostname}**\n\nPlease wait..."
     )
     await interaction.followup.send(embed=embed)
     
+    # Update restart counter while the VPS stops and settles
+    stats_task = asyncio.create_task(increment_stat('total_restarts'))
+    
     # Stop if running
-    if vps[13] == "running":
+    if vps.status == "running":
         await stop_vps(vps_id)
         await asyncio.sleep(3)
     
     # Start VPS
     success = await start_vps(vps_id)
-    
-    # Update restart counter
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute("UPDATE statistics SET value = CAST(value AS INTEGER) + 1 WHERE key = 'total_restarts'")
-    conn.commit()
-    conn.close()
+    await stats_task
     
     if success:
         embed = create_success_embed(
             "VPS Restarted Successfully!",
-            f"🔄 VPS **{vps[3]}** has been restarted!\n\n"
+            f"🔄 VPS **{vps.hostname}** has been restarted!\n\n"
             f"⏰ Wait **30-60 seconds** for the system to fully boot."
         )
         embed.add_field(
             name="🔗 SSH Connection",
-            value=f"```bash\nssh -p {vps[6]} {vps[4]}@{DEFAULT_HOSTNAME}```",
+            value=f"```bash\n{vps.ssh_command}```",
             inline=False
         )
     else:
         embed = create_error_embed(
             "Failed to Restart VPS",
-            f"❌ Could not restart VPS **{vps[3]}**"
+            f"❌ Could not restart VPS **{vps.hostname}**"
         )
     
     await interaction.edit_original_response(embed=embed)
@@ -1293,16 +1827,8 @@ async def restart_vps_command(interaction: discord.Interaction, vps_id: str):
 @app_commands.describe(vps_id="The ID of the VPS")
 async def vps_info_command(interaction: discord.Interaction, vps_id: str):
     """Get VPS information"""
-    vps = get_vps_by_id(vps_id)
-    
-    if not vps:
-        embed = create_error_embed("VPS Not Found", f"❌ No VPS found with ID: `{vps_id}`")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        return
-    
-    if vps[2] != interaction.user.id and not is_admin(interaction.user.id):
-        embed = create_error_embed("Access Denied", "🔒 You don't own this VPS!")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+    vps = await _resolve_vps(interaction, vps_id)
+    if vps is None:
         return
     
     embed = create_vps_info_embed(vps)
@@ -1312,45 +1838,20 @@ async def vps_info_command(interaction: discord.Interaction, vps_id: str):
 @app_commands.describe(vps_id="The ID of the VPS to delete")
 async def delete_vps_command(interaction: discord.Interaction, vps_id: str):
     """Delete a VPS instance"""
-    vps = get_vps_by_id(vps_id)
-    
-    if not vps:
-        embed = create_error_embed("VPS Not Found", f"❌ No VPS found with ID: `{vps_id}`")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        return
-    
-    if vps[2] != interaction.user.id and not is_admin(interaction.user.id):
-        embed = create_error_embed("Access Denied", "🔒 You don't own this VPS!")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+    vps = await _resolve_vps(interaction, vps_id)
+    if vps is None:
         return
     
     # Confirmation view
-    class ConfirmView(discord.ui.View):
-        def __init__(self):
-            super().__init__(timeout=60)
-            self.value = None
-        
-        @discord.ui.button(label="✅ Confirm Delete", style=discord.ButtonStyle.danger)
-        async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
-            self.value = True
-            await interaction.response.defer()
-            self.stop()
-        
-        @discord.ui.button(label="❌ Cancel", style=discord.ButtonStyle.secondary)
-        async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
-            self.value = False
-            await interaction.response.defer()
-            self.stop()
-    
     view = ConfirmView()
     
     embed = create_warning_embed(
         "Confirm VPS Deletion",
-        f"⚠️ Are you sure you want to delete VPS **{vps[3]}**?\n\n"
+        f"⚠️ Are you sure you want to delete VPS **{vps.hostname}**?\n\n"
         f"```diff\n"
         f"- This action cannot be undone!\n"
         f"- All data will be permanently lost!\n"
-        f"- VPS ID: {vps[1]}\n"
+        f"- VPS ID: {vps.vps_id}\n"
         f"```"
     )
     
@@ -1359,31 +1860,24 @@ async def delete_vps_command(interaction: discord.Interaction, vps_id: str):
     
     if view.value:
         # Stop VPS if running
-        if vps[13] == "running":
+        if vps.status == "running":
             await stop_vps(vps_id)
         
         # Delete files
         try:
-            if os.path.exists(vps[11]):
-                os.remove(vps[11])
-            if os.path.exists(vps[12]):
-                os.remove(vps[12])
-            pid_file = f"{VM_DIR}/{vps_id}.pid"
-            if os.path.exists(pid_file):
-                os.remove(pid_file)
+            await asyncio.to_thread(
+                _remove_files, vps.image_file, vps.seed_file, f"{VM_DIR}/{vps_id}.pid"
+            )
         except Exception as e:
             logger.error(f"Error deleting files: {str(e)}")
         
         # Delete from database
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM vps WHERE vps_id = ?", (vps_id,))
-        conn.commit()
-        conn.close()
+        await db_pool.execute(SQL_DELETE_VPS, (vps_id,))
+        get_vps_by_id.invalidate(vps_id)
         
         embed = create_success_embed(
             "VPS Deleted Successfully!",
-            f"🗑️ VPS **{vps[3]}** has been permanently deleted.\n\n"
+            f"🗑️ VPS **{vps.hostname}** has been permanently deleted.\n\n"
             f"All associated data has been removed."
         )
         await interaction.edit_original_response(embed=embed, view=None)
@@ -1399,31 +1893,20 @@ async def delete_vps_command(interaction: discord.Interaction, vps_id: str):
 @app_commands.describe(vps_id="The ID of the VPS")
 async def change_password_command(interaction: discord.Interaction, vps_id: str):
     """Change VPS SSH password"""
-    vps = get_vps_by_id(vps_id)
-    
-    if not vps:
-        embed = create_error_embed("VPS Not Found", f"❌ No VPS found with ID: `{vps_id}`")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        return
-    
-    if vps[2] != interaction.user.id and not is_admin(interaction.user.id):
-        embed = create_error_embed("Access Denied", "🔒 You don't own this VPS!")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+    vps = await _resolve_vps(interaction, vps_id)
+    if vps is None:
         return
     
     # Generate new password
     new_password = generate_password()
     
     # Update database
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute("UPDATE vps SET password = ? WHERE vps_id = ?", (new_password, vps_id))
-    conn.commit()
-    conn.close()
+    await db_pool.execute(SQL_SET_VPS_PASSWORD, (new_password, vps_id))
+    get_vps_by_id.invalidate(vps_id)
     
     embed = create_success_embed(
         "Password Changed Successfully!",
-        f"🔐 New SSH password generated for VPS **{vps[3]}**"
+        f"🔐 New SSH password generated for VPS **{vps.hostname}**"
     )
     embed.add_field(
         name="🔑 New Password",
@@ -1446,32 +1929,27 @@ async def change_password_command(interaction: discord.Interaction, vps_id: str)
 @app_commands.describe(vps_id="The ID of the VPS")
 async def vps_stats_command(interaction: discord.Interaction, vps_id: str):
     """View VPS statistics"""
-    vps = get_vps_by_id(vps_id)
-    
-    if not vps:
-        embed = create_error_embed("VPS Not Found", f"❌ No VPS found with ID: `{vps_id}`")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        return
-    
-    if vps[2] != interaction.user.id and not is_admin(interaction.user.id):
-        embed = create_error_embed("Access Denied", "🔒 You don't own this VPS!")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+    vps = await _resolve_vps(interaction, vps_id)
+    if vps is None:
         return
     
     embed = discord.Embed(
         title=f"📊 VPS Statistics",
-        description=f"**{vps[3]}** (`{vps[1]}`)",
-        color=discord.Color.blue() if vps[13] == "running" else discord.Color.greyple(),
-        timestamp=datetime.now(timezone.utc)
+        description=f"**{vps.hostname}** (`{vps.vps_id}`)",
+        color=discord.Color.blue() if vps.status == "running" else discord.Color.greyple(),
+        timestamp=utcnow()
     )
     
-    if vps[13] == "running" and vps[14]:
+    if vps.status == "running" and vps.pid:
         try:
-            process = psutil.Process(vps[14])
-            cpu_percent = process.cpu_percent(interval=1)
-            memory_info = process.memory_info()
+            process = psutil.Process(vps.pid)
+            # Sample CPU over one second without blocking the event loop
+            process.cpu_percent(None)
+            await asyncio.sleep(1)
+            cpu_percent = process.cpu_percent(None)
+            memory_info = await asyncio.to_thread(process.memory_info)
             memory_mb = memory_info.rss / 1024 / 1024
-            memory_percent = (memory_mb / vps[7]) * 100
+            memory_percent = (memory_mb / vps.memory) * 100
             
             embed.add_field(
                 name="🟢 Status",
@@ -1485,7 +1963,7 @@ async def vps_stats_command(interaction: discord.Interaction, vps_id: str):
             )
             embed.add_field(
                 name="🧠 Memory",
-                value=f"```{memory_mb:.0f} MB / {vps[7]} MB ({memory_percent:.1f}%)```",
+                value=f"```{memory_mb:.0f} MB / {vps.memory} MB ({memory_percent:.1f}%)```",
                 inline=True
             )
         except:
@@ -1502,8 +1980,11 @@ async def vps_stats_command(interaction: discord.Interaction, vps_id: str):
         )
     
     # Disk usage
-    if os.path.exists(vps[11]):
-        disk_size = os.path.getsize(vps[11]) / 1024 / 1024 / 1024
+    try:
+        disk_size = await asyncio.to_thread(os.path.getsize, vps.image_file) / 1024 / 1024 / 1024
+    except OSError:
+        disk_size = None
+    if disk_size is not None:
         embed.add_field(
             name="💾 Disk Usage",
             value=f"```{disk_size:.2f} GB```",
@@ -1514,31 +1995,23 @@ async def vps_stats_command(interaction: discord.Interaction, vps_id: str):
         name="🔧 Allocated Resources",
         value=(
             f"```yml\n"
-            f"Memory : {vps[7]} MB\n"
-            f"CPUs   : {vps[8]} cores\n"
-            f"Disk   : {vps[9]}\n"
+            f"Memory : {vps.memory} MB\n"
+            f"CPUs   : {vps.cpus} cores\n"
+            f"Disk   : {vps.disk_size}\n"
             f"```"
         ),
         inline=False
     )
     
-    embed.set_footer(text="🚀 HOPINGBOYZ VPS Manager")
+    embed.set_footer(text=EMBED_FOOTER_TEXT)
     await interaction.response.send_message(embed=embed)
 
 @bot.tree.command(name="vps_logs", description="📜 View VPS console logs")
 @app_commands.describe(vps_id="The ID of the VPS", lines="Number of lines to show (default: 20)")
 async def vps_logs_command(interaction: discord.Interaction, vps_id: str, lines: int = 20):
     """View VPS logs"""
-    vps = get_vps_by_id(vps_id)
-    
-    if not vps:
-        embed = create_error_embed("VPS Not Found", f"❌ No VPS found with ID: `{vps_id}`")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        return
-    
-    if vps[2] != interaction.user.id and not is_admin(interaction.user.id):
-        embed = create_error_embed("Access Denied", "🔒 You don't own this VPS!")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+    vps = await _resolve_vps(interaction, vps_id)
+    if vps is None:
         return
     
     logfile = f"{VM_DIR}/{vps_id}.log"
@@ -1546,7 +2019,7 @@ async def vps_logs_command(interaction: discord.Interaction, vps_id: str, lines:
     if not os.path.exists(logfile):
         embed = create_info_embed(
             "No Logs Available",
-            f"📜 No logs found for VPS **{vps[3]}**\n\n"
+            f"📜 No logs found for VPS **{vps.hostname}**\n\n"
             f"Logs are only created when VPS is running without GUI mode."
         )
         await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -1554,14 +2027,7 @@ async def vps_logs_command(interaction: discord.Interaction, vps_id: str, lines:
     
     try:
         # Read last N lines
-        process = await asyncio.create_subprocess_exec(
-            'tail', f'-n{lines}', logfile,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await process.communicate()
-        
-        log_content = stdout.decode()
+        log_content = await tail_file(logfile, lines)
         
         if not log_content.strip():
             log_content = "No logs available yet. VPS may still be booting."
@@ -1572,9 +2038,9 @@ async def vps_logs_command(interaction: discord.Interaction, vps_id: str, lines:
         
         embed = discord.Embed(
             title=f"📜 VPS Console Logs",
-            description=f"**{vps[3]}** (Last {lines} lines)",
+            description=f"**{vps.hostname}** (Last {lines} lines)",
             color=discord.Color.blue(),
-            timestamp=datetime.now(timezone.utc)
+            timestamp=utcnow()
         )
         
         embed.add_field(
@@ -1583,7 +2049,7 @@ async def vps_logs_command(interaction: discord.Interaction, vps_id: str, lines:
             inline=False
         )
         
-        embed.set_footer(text="🚀 HOPINGBOYZ VPS Manager")
+        embed.set_footer(text=EMBED_FOOTER_TEXT)
         await interaction.response.send_message(embed=embed, ephemeral=True)
         
     except Exception as e:
@@ -1597,29 +2063,21 @@ async def vps_logs_command(interaction: discord.Interaction, vps_id: str, lines:
 @app_commands.describe(vps_id="The ID of the VPS")
 async def vps_shell_command(interaction: discord.Interaction, vps_id: str):
     """Get shell access command"""
-    vps = get_vps_by_id(vps_id)
-    
-    if not vps:
-        embed = create_error_embed("VPS Not Found", f"❌ No VPS found with ID: `{vps_id}`")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        return
-    
-    if vps[2] != interaction.user.id and not is_admin(interaction.user.id):
-        embed = create_error_embed("Access Denied", "🔒 You don't own this VPS!")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+    vps = await _resolve_vps(interaction, vps_id)
+    if vps is None:
         return
     
     embed = discord.Embed(
         title=f"💻 VPS Shell Access",
-        description=f"**{vps[3]}** (`{vps[1]}`)",
-        color=discord.Color.green() if vps[13] == "running" else discord.Color.greyple(),
-        timestamp=datetime.now(timezone.utc)
+        description=f"**{vps.hostname}** (`{vps.vps_id}`)",
+        color=discord.Color.green() if vps.status == "running" else discord.Color.greyple(),
+        timestamp=utcnow()
     )
     
-    if vps[13] == "running":
+    if vps.status == "running":
         embed.add_field(
             name="🔗 SSH Connection",
-            value=f"```bash\nssh -p {vps[6]} {vps[4]}@{DEFAULT_HOSTNAME}```",
+            value=f"```bash\n{vps.ssh_command}```",
             inline=False
         )
         
@@ -1627,16 +2085,16 @@ async def vps_shell_command(interaction: discord.Interaction, vps_id: str):
             name="🔐 Credentials",
             value=(
                 f"**Host:** `{DEFAULT_HOSTNAME}`\n"
-                f"**Port:** `{vps[6]}`\n"
-                f"**Username:** `{vps[4]}`\n"
-                f"**Password:** ||`{vps[5]}`||"
+                f"**Port:** `{vps.ssh_port}`\n"
+                f"**Username:** `{vps.username}`\n"
+                f"**Password:** ||`{vps.password}`||"
             ),
             inline=False
         )
         
         embed.add_field(
             name="📋 One-Line Connection",
-            value=f"```bash\nsshpass -p '{vps[5]}' ssh -o StrictHostKeyChecking=no -p {vps[6]} {vps[4]}@{DEFAULT_HOSTNAME}```",
+            value=f"```bash\n{vps.one_liner}```",
             inline=False
         )
         
@@ -1646,7 +2104,7 @@ async def vps_shell_command(interaction: discord.Interaction, vps_id: str):
                 "• Use `-o StrictHostKeyChecking=no` to skip host key verification\n"
                 "• Install `sshpass` for password-less login: `sudo apt install sshpass`\n"
                 "• Copy files: `scp -P {port} file.txt {user}@{host}:`"
-            ).format(port=vps[6], user=vps[4], host=DEFAULT_HOSTNAME),
+            ).format(port=vps.ssh_port, user=vps.username, host=DEFAULT_HOSTNAME),
             inline=False
         )
     else:
@@ -1656,119 +2114,138 @@ async def vps_shell_command(interaction: discord.Interaction, vps_id: str):
             inline=False
         )
     
-    embed.set_footer(text="🚀 HOPINGBOYZ VPS Manager")
+    embed.set_footer(text=EMBED_FOOTER_TEXT)
     await interaction.response.send_message(embed=embed, ephemeral=True)
 
 # ============================================
 # 👑 ADMIN COMMANDS (continued)
 # ============================================
 
+USER_FETCH_CONCURRENCY = 10  # Parallel Discord API lookups per listing
+USER_CACHE_TTL = 3600  # Usernames rarely change, keep them for an hour
+
+@async_ttl_cache(maxsize=4096, ttl=USER_CACHE_TTL)
+async def cached_fetch_user(user_id: int) -> discord.User:
+    """Fetch a user, preferring the client cache over the API"""
+    user = bot.get_user(user_id)
+    if user is not None:
+        return user
+    return await bot.fetch_user(user_id)
+
+ADMIN_LIST_LIMIT = 20  # VPS entries shown by /admin_list
+BANNED_LIST_LIMIT = 25  # Bans shown by /list_banned (Discord's field limit)
+
+# Per-row field templates for the admin listings
+ADMIN_LIST_FIELD = (
+    "{status_emoji} **Status:** `{status}`\n"
+    "👤 **Owner:** {owner}\n"
+    "💻 **OS:** {os_name}\n"
+    "🧠 **RAM:** `{memory} MB` | ⚡ **CPU:** `{cpus}` | 💾 **Disk:** `{disk_size}`"
+)
+BANNED_LIST_FIELD = (
+    "👤 **User:** {user}\n"
+    "📝 **Reason:** {reason}\n"
+    "👮 **Banned By:** {banned_by}\n"
+    "📅 **Date:** <t:{banned_ts}:R>"
+)
+
+async def fetch_users(user_ids) -> Dict[int, Optional[discord.User]]:
+    """Resolve user IDs concurrently, mapping failed lookups to None"""
+    semaphore = asyncio.Semaphore(USER_FETCH_CONCURRENCY)
+    
+    async def fetch(user_id: int):
+        async with semaphore:
+            try:
+                return user_id, await cached_fetch_user(user_id)
+            except Exception as e:
+                # One failed lookup only degrades its own row
+                logger.warning(f"⚠️ Failed to fetch user {user_id}: {str(e)}")
+                return user_id, None
+    
+    return dict(await asyncio.gather(*(fetch(user_id) for user_id in set(user_ids))))
+
 @bot.tree.command(name="admin_list", description="👑 [ADMIN] View all VPS across platform")
+@require_admin
 async def admin_list_command(interaction: discord.Interaction):
     """List all VPS (admin only)"""
-    if not (is_admin(interaction.user.id) or (isinstance(interaction.user, discord.Member) and has_admin_role(interaction.user))):
-        embed = create_error_embed("Access Denied", "❌ This command requires admin permissions!")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        return
+    await interaction.response.defer(thinking=True, ephemeral=True)
     
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM vps ORDER BY created_at DESC")
-    all_vps = cursor.fetchall()
-    conn.close()
+    # Only the shown page is read; the total rides along as a trailing column
+    all_vps = await db_pool.fetchall(
+        "SELECT vps_id, hostname, owner_id, memory, cpus, disk_size, os_type, status, "
+        "(SELECT COUNT(*) FROM vps) FROM vps ORDER BY created_at DESC LIMIT ?",
+        (ADMIN_LIST_LIMIT,)
+    )
     
     if not all_vps:
         embed = create_info_embed("No VPS Found", "📦 There are no VPS instances on the platform.")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
         return
     
+    total_vps = all_vps[0][-1]
     embed = discord.Embed(
         title=f"👑 All VPS Instances",
-        description=f"```Total: {len(all_vps)} VPS across platform```",
+        description=f"```Total: {total_vps} VPS across platform```",
         color=discord.Color.gold(),
-        timestamp=datetime.now(timezone.utc)
+        timestamp=utcnow()
     )
     
-    for vps in all_vps[:20]:
-        status_emoji = "🟢" if vps[13] == "running" else "🔴"
-        try:
-            owner = await bot.fetch_user(vps[2])
-            owner_name = f"{owner.name}"
-        except:
-            owner_name = f"ID: {vps[2]}"
+    owners = await fetch_users(owner_id for _, _, owner_id, *_ in all_vps)
+    
+    for vps_id, hostname, owner_id, memory, cpus, disk_size, os_type, status, _ in all_vps:
+        status_emoji = "🟢" if status == "running" else "🔴"
+        owner = owners[owner_id]
+        owner_name = f"{owner.name}" if owner else f"ID: {owner_id}"
         
-        value = (
-            f"{status_emoji} **Status:** `{vps[13].upper()}`\n"
-            f"👤 **Owner:** {owner_name}\n"
-            f"💻 **OS:** {OS_IMAGES.get(vps[10], {}).get('name', vps[10])}\n"
-            f"🧠 **RAM:** `{vps[7]} MB` | ⚡ **CPU:** `{vps[8]}` | 💾 **Disk:** `{vps[9]}`"
+        value = ADMIN_LIST_FIELD.format(
+            status_emoji=status_emoji,
+            status=status.upper(),
+            owner=owner_name,
+            os_name=OS_NAME_BY_KEY.get(os_type, os_type),
+            memory=memory,
+            cpus=cpus,
+            disk_size=disk_size
         )
         
         embed.add_field(
-            name=f"📦 {vps[3]} (`{vps[1]}`)",
+            name=f"📦 {hostname} (`{vps_id}`)",
             value=value,
             inline=False
         )
     
-    if len(all_vps) > 20:
-        embed.set_footer(text=f"Showing 20 of {len(all_vps)} VPS • 🚀 HOPINGBOYZ VPS Manager")
+    if total_vps > len(all_vps):
+        embed.set_footer(text=f"Showing {len(all_vps)} of {total_vps} VPS • {EMBED_FOOTER_TEXT}")
     else:
-        embed.set_footer(text="🚀 HOPINGBOYZ VPS Manager")
+        embed.set_footer(text=EMBED_FOOTER_TEXT)
     
-    await interaction.response.send_message(embed=embed, ephemeral=True)
+    await interaction.followup.send(embed=embed, ephemeral=True)
 
 @bot.tree.command(name="admin_stats", description="📊 [ADMIN] View system statistics")
+@require_admin
 async def admin_stats_command(interaction: discord.Interaction):
     """View system statistics (admin only)"""
-    if not (is_admin(interaction.user.id) or (isinstance(interaction.user, discord.Member) and has_admin_role(interaction.user))):
-        embed = create_error_embed("Access Denied", "❌ This command requires admin permissions!")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        return
-    
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    
-    cursor.execute("SELECT COUNT(*) FROM vps")
-    total_vps = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM vps WHERE status = 'running'")
-    running_vps = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT SUM(memory), SUM(cpus) FROM vps")
-    resources = cursor.fetchone()
-    total_memory = resources[0] or 0
-    total_cpus = resources[1] or 0
-    
-    cursor.execute("SELECT value FROM statistics WHERE key = 'total_vps_created'")
-    total_created = cursor.fetchone()[0]
+    await interaction.response.defer(thinking=True, ephemeral=True)
     
-    cursor.execute("SELECT value FROM statistics WHERE key = 'total_restarts'")
-    total_restarts = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT value FROM statistics WHERE key = 'total_downloads'")
-    total_downloads = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM banned_users")
-    banned_count = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM admins")
-    admin_count = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(DISTINCT owner_id) FROM vps")
-    unique_users = cursor.fetchone()[0]
-    
-    conn.close()
+    # Platform figures and host resources are read concurrently
+    stats, memory, disk = await asyncio.gather(
+        db_pool.fetchone(SQL_ADMIN_STATS),
+        asyncio.to_thread(psutil.virtual_memory),
+        asyncio.to_thread(psutil.disk_usage, '/')
+    )
+    (total_vps, running_vps, total_memory, total_cpus,
+     banned_count, admin_count, unique_users) = stats
+    total_created = STATS.get('total_vps_created', 0)
+    total_restarts = STATS.get('total_restarts', 0)
+    total_downloads = STATS.get('total_downloads', 0)
     
     # System resources
-    cpu_percent = psutil.cpu_percent(interval=1)
-    memory = psutil.virtual_memory()
-    disk = psutil.disk_usage('/')
+    cpu_percent = psutil.cpu_percent(interval=None)  # Usage since the previous call
     
     embed = discord.Embed(
         title="📊 System Statistics Dashboard",
         description="```Real-time platform monitoring```",
         color=discord.Color.gold(),
-        timestamp=datetime.now(timezone.utc)
+        timestamp=utcnow()
     )
     
     embed.add_field(
@@ -1839,32 +2316,28 @@ async def admin_stats_command(interaction: discord.Interaction):
         inline=True
     )
     
-    embed.set_footer(text="🚀 HOPINGBOYZ VPS Manager")
-    await interaction.response.send_message(embed=embed, ephemeral=True)
+    embed.set_footer(text=EMBED_FOOTER_TEXT)
+    await interaction.followup.send(embed=embed, ephemeral=True)
 
 @bot.tree.command(name="ban_user", description="🚫 [ADMIN] Ban a user from creating VPS")
 @app_commands.describe(user="The user to ban", reason="Reason for ban")
+@require_admin
 async def ban_user_command(interaction: discord.Interaction, user: discord.User, reason: str = "No reason provided"):
     """Ban a user (admin only)"""
-    if not (is_admin(interaction.user.id) or (isinstance(interaction.user, discord.Member) and has_admin_role(interaction.user))):
-        embed = create_error_embed("Access Denied", "❌ This command requires admin permissions!")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        return
-    
-    if is_admin(user.id) or (isinstance(user, discord.Member) and has_admin_role(user)):
+    # Checked without get_permissions so the target's cached flags are untouched
+    if await is_admin(user.id) or (isinstance(user, discord.Member) and has_admin_role(user)):
         embed = create_error_embed("Cannot Ban Admin", "❌ You cannot ban an administrator!")
         await interaction.response.send_message(embed=embed, ephemeral=True)
         return
     
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
+    inserted = await db_pool.execute(
+        "INSERT INTO banned_users (user_id, banned_by, reason) VALUES (?, ?, ?) "
+        "ON CONFLICT(user_id) DO NOTHING",
+        (user.id, interaction.user.id, reason)
+    )
     
-    try:
-        cursor.execute(
-            "INSERT INTO banned_users (user_id, banned_by, reason) VALUES (?, ?, ?)",
-            (user.id, interaction.user.id, reason)
-        )
-        conn.commit()
+    if inserted:
+        is_banned.invalidate(user.id)
         
         embed = create_success_embed(
             "User Banned Successfully!",
@@ -1874,27 +2347,19 @@ async def ban_user_command(interaction: discord.Interaction, user: discord.User,
         embed.add_field(name="👮 Banned By", value=interaction.user.mention, inline=True)
         
         logger.info(f"✅ User {user.id} banned by {interaction.user.id}")
-        
-    except sqlite3.IntegrityError:
+    else:
         embed = create_info_embed("Already Banned", f"🚫 {user.mention} is already banned!")
     
-    conn.close()
     await interaction.response.send_message(embed=embed)
 
 @bot.tree.command(name="unban_user", description="✅ [ADMIN] Unban a user")
 @app_commands.describe(user="The user to unban")
+@require_admin
 async def unban_user_command(interaction: discord.Interaction, user: discord.User):
     """Unban a user (admin only)"""
-    if not (is_admin(interaction.user.id) or (isinstance(interaction.user, discord.Member) and has_admin_role(interaction.user))):
-        embed = create_error_embed("Access Denied", "❌ This command requires admin permissions!")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        return
-    
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM banned_users WHERE user_id = ?", (user.id,))
+    deleted = await db_pool.execute("DELETE FROM banned_users WHERE user_id = ?", (user.id,))
     
-    if cursor.rowcount > 0:
+    if deleted > 0:
         embed = create_success_embed(
             "User Unbanned Successfully!",
             f"✅ {user.mention} can now create VPS again."
@@ -1903,85 +2368,73 @@ async def unban_user_command(interaction: discord.Interaction, user: discord.Use
     else:
         embed = create_info_embed("Not Banned", f"ℹ️ {user.mention} is not banned!")
     
-    conn.commit()
-    conn.close()
+    is_banned.invalidate(user.id)
     await interaction.response.send_message(embed=embed)
 
 @bot.tree.command(name="list_banned", description="📋 [ADMIN] View all banned users")
+@require_admin
 async def list_banned_command(interaction: discord.Interaction):
     """List all banned users (admin only)"""
-    if not (is_admin(interaction.user.id) or (isinstance(interaction.user, discord.Member) and has_admin_role(interaction.user))):
-        embed = create_error_embed("Access Denied", "❌ This command requires admin permissions!")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        return
+    await interaction.response.defer(thinking=True, ephemeral=True)
     
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM banned_users ORDER BY banned_at DESC")
-    banned = cursor.fetchall()
-    conn.close()
+    banned = await db_pool.fetchall(
+        "SELECT user_id, banned_by, reason, banned_at, (SELECT COUNT(*) FROM banned_users) "
+        "FROM banned_users ORDER BY banned_at DESC LIMIT ?",
+        (BANNED_LIST_LIMIT,)
+    )
     
     if not banned:
         embed = create_info_embed("No Banned Users", "✅ There are no banned users!")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
         return
     
     embed = discord.Embed(
         title="🚫 Banned Users List",
-        description=f"```Total: {len(banned)} banned users```",
+        description=f"```Total: {banned[0][-1]} banned users```",
         color=discord.Color.red(),
-        timestamp=datetime.now(timezone.utc)
+        timestamp=utcnow()
     )
     
-    for ban in banned[:25]:
-        try:
-            user = await bot.fetch_user(ban[0])
-            user_name = f"{user.name}#{user.discriminator}"
-        except:
-            user_name = f"Unknown (ID: {ban[0]})"
+    # Banned users and the admins who banned them are resolved in one batch
+    users = await fetch_users([user_id for user_id, *_ in banned] + [banned_by_id for _, banned_by_id, *_ in banned])
+    
+    for user_id, banned_by_id, reason, banned_at, _ in banned:
+        user = users[user_id]
+        user_name = f"{user.name}#{user.discriminator}" if user else f"Unknown (ID: {user_id})"
         
-        try:
-            banned_by = await bot.fetch_user(ban[1])
-            banned_by_name = f"{banned_by.name}"
-        except:
-            banned_by_name = f"ID: {ban[1]}"
+        banned_by = users[banned_by_id]
+        banned_by_name = f"{banned_by.name}" if banned_by else f"ID: {banned_by_id}"
         
-        banned_ts = int(datetime.fromisoformat(ban[3]).timestamp())
+        banned_ts = int(datetime.fromisoformat(banned_at).timestamp())
         
-        value = (
-            f"👤 **User:** {user_name}\n"
-            f"📝 **Reason:** {ban[2]}\n"
-            f"👮 **Banned By:** {banned_by_name}\n"
-            f"📅 **Date:** <t:{banned_ts}:R>"
+        value = BANNED_LIST_FIELD.format(
+            user=user_name,
+            reason=reason,
+            banned_by=banned_by_name,
+            banned_ts=banned_ts
         )
         
         embed.add_field(
-            name=f"🚫 Ban #{ban[0]}",
+            name=f"🚫 Ban #{user_id}",
             value=value,
             inline=False
         )
     
-    embed.set_footer(text="🚀 HOPINGBOYZ VPS Manager")
-    await interaction.response.send_message(embed=embed, ephemeral=True)
+    embed.set_footer(text=EMBED_FOOTER_TEXT)
+    await interaction.followup.send(embed=embed, ephemeral=True)
 
 @bot.tree.command(name="add_admin", description="👑 [ADMIN] Grant admin permissions")
 @app_commands.describe(user="The user to make admin")
+@require_admin
 async def add_admin_command(interaction: discord.Interaction, user: discord.User):
     """Add admin (admin only)"""
-    if not (is_admin(interaction.user.id) or (isinstance(interaction.user, discord.Member) and has_admin_role(interaction.user))):
-        embed = create_error_embed("Access Denied", "❌ This command requires admin permissions!")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        return
-    
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
+    inserted = await db_pool.execute(
+        "INSERT INTO admins (user_id, added_by) VALUES (?, ?) ON CONFLICT(user_id) DO NOTHING",
+        (user.id, interaction.user.id)
+    )
     
-    try:
-        cursor.execute(
-            "INSERT INTO admins (user_id, added_by) VALUES (?, ?)",
-            (user.id, interaction.user.id)
-        )
-        conn.commit()
+    if inserted:
+        invalidate_admin(user.id)
         
         embed = create_success_embed(
             "Admin Added Successfully!",
@@ -1990,27 +2443,23 @@ async def add_admin_command(interaction: discord.Interaction, user: discord.User
         )
         
         logger.info(f"✅ User {user.id} made admin by {interaction.user.id}")
-        
-    except sqlite3.IntegrityError:
+    else:
         embed = create_info_embed("Already Admin", f"👑 {user.mention} is already an administrator!")
     
-    conn.close()
     await interaction.response.send_message(embed=embed)
 
 @bot.tree.command(name="remove_admin", description="🔻 [OWNER] Remove admin permissions")
 @app_commands.describe(user="The user to remove admin from")
 async def remove_admin_command(interaction: discord.Interaction, user: discord.User):
     """Remove admin (owner only)"""
-    if not is_owner(interaction.user.id):
+    if not await get_permissions(interaction.user) & PERM_OWNER:
         embed = create_error_embed("Access Denied", "❌ Only the bot owner can use this command!")
         await interaction.response.send_message(embed=embed, ephemeral=True)
         return
     
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM admins WHERE user_id = ?", (user.id,))
+    deleted = await db_pool.execute("DELETE FROM admins WHERE user_id = ?", (user.id,))
     
-    if cursor.rowcount > 0:
+    if deleted > 0:
         embed = create_success_embed(
             "Admin Removed Successfully!",
             f"🔻 {user.mention} is no longer an administrator."
@@ -2019,24 +2468,18 @@ async def remove_admin_command(interaction: discord.Interaction, user: discord.U
     else:
         embed = create_info_embed("Not Admin", f"ℹ️ {user.mention} is not an administrator!")
     
-    conn.commit()
-    conn.close()
+    invalidate_admin(user.id)
     await interaction.response.send_message(embed=embed)
 
 @bot.tree.command(name="force_stop", description="⚠️ [ADMIN] Force stop any VPS")
 @app_commands.describe(vps_id="The ID of the VPS to force stop")
+@require_admin
 async def force_stop_command(interaction: discord.Interaction, vps_id: str):
     """Force stop a VPS (admin only)"""
-    if not (is_admin(interaction.user.id) or (isinstance(interaction.user, discord.Member) and has_admin_role(interaction.user))):
-        embed = create_error_embed("Access Denied", "❌ This command requires admin permissions!")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        return
-    
-    vps = get_vps_by_id(vps_id)
+    vps = await get_vps_by_id(vps_id)
     
     if not vps:
-        embed = create_error_embed("VPS Not Found", f"❌ No VPS found with ID: `{vps_id}`")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.response.send_message(embed=vps_not_found_embed(vps_id), ephemeral=True)
         return
     
     await interaction.response.defer(thinking=True)
@@ -2046,34 +2489,67 @@ async def force_stop_command(interaction: discord.Interaction, vps_id: str):
     if success:
         embed = create_success_embed(
             "VPS Force Stopped!",
-            f"⚠️ VPS **{vps[3]}** has been force stopped by admin.\n\n"
-            f"Owner: <@{vps[2]}>"
+            f"⚠️ VPS **{vps.hostname}** has been force stopped by admin.\n\n"
+            f"Owner: <@{vps.owner_id}>"
         )
         logger.info(f"✅ VPS {vps_id} force stopped by admin {interaction.user.id}")
     else:
         embed = create_error_embed(
             "Failed to Stop VPS",
-            f"❌ Could not stop VPS **{vps[3]}**"
+            f"❌ Could not stop VPS **{vps.hostname}**"
         )
     
     await interaction.followup.send(embed=embed)
 
+CLEANUP_WORKERS = 8  # Parallel unlinks when removing orphaned files
+
+def _remove_orphan(entry: os.DirEntry) -> Optional[str]:
+    """Delete one orphaned file, returning its description or None on failure"""
+    try:
+        # DirEntry caches its stat result, so the size costs at most one call
+        file_size = entry.stat().st_size / 1024 / 1024  # MB
+        os.remove(entry.path)
+        logger.info(f"🧹 Cleaned orphaned file: {entry.name}")
+        return f"{entry.name} ({file_size:.1f}MB)"
+    except Exception as e:
+        logger.error(f"Failed to remove {entry.name}: {str(e)}")
+        return None
+
+def _scan_and_clean(valid_files: set) -> Tuple[List[str], List[str]]:
+    """Remove orphaned VPS files from VM_DIR, returning (cleaned, cache files)"""
+    orphans = []
+    skipped_cache = []
+    
+    if not os.path.exists(VM_DIR):
+        return [], skipped_cache
+    
+    with os.scandir(VM_DIR) as entries:
+        for entry in entries:
+            # Skip cache files (they are intentional)
+            if entry.name.startswith('cache_'):
+                skipped_cache.append(entry.name)
+                continue
+            
+            # Collect orphaned VPS files
+            if entry.name.startswith('vps_') and entry.name not in valid_files and entry.is_file():
+                orphans.append(entry)
+    
+    if not orphans:
+        return [], skipped_cache
+    
+    # Slow unlinks of large disk images overlap instead of queueing
+    with ThreadPoolExecutor(max_workers=CLEANUP_WORKERS) as executor:
+        cleaned = [result for result in executor.map(_remove_orphan, orphans) if result]
+    return cleaned, skipped_cache
+
 @bot.tree.command(name="cleanup", description="🧹 [ADMIN] Clean orphaned VPS files")
+@require_admin
 async def cleanup_command(interaction: discord.Interaction):
     """Cleanup orphaned files (admin only)"""
-    if not (is_admin(interaction.user.id) or (isinstance(interaction.user, discord.Member) and has_admin_role(interaction.user))):
-        embed = create_error_embed("Access Denied", "❌ This command requires admin permissions!")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        return
-    
     await interaction.response.defer(thinking=True)
     
     # Get all VPS IDs from database
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute("SELECT vps_id, image_file, seed_file FROM vps")
-    db_vps = cursor.fetchall()
-    conn.close()
+    db_vps = await db_pool.fetchall("SELECT vps_id, image_file, seed_file FROM vps")
     
     valid_files = set()
     for vps in db_vps:
@@ -2083,31 +2559,12 @@ async def cleanup_command(interaction: discord.Interaction):
         valid_files.add(f"{vps[0]}.log")  # log file
     
     # Scan VM directory
-    cleaned = []
-    skipped_cache = []
-    
-    if os.path.exists(VM_DIR):
-        for filename in os.listdir(VM_DIR):
-            # Skip cache files (they are intentional)
-            if filename.startswith('cache_'):
-                skipped_cache.append(filename)
-                continue
-            
-            # Clean orphaned VPS files
-            if filename.startswith('vps_') and filename not in valid_files:
-                file_path = os.path.join(VM_DIR, filename)
-                try:
-                    file_size = os.path.getsize(file_path) / 1024 / 1024  # MB
-                    os.remove(file_path)
-                    cleaned.append(f"{filename} ({file_size:.1f}MB)")
-                    logger.info(f"🧹 Cleaned orphaned file: {filename}")
-                except Exception as e:
-                    logger.error(f"Failed to remove {filename}: {str(e)}")
+    cleaned, skipped_cache = await asyncio.to_thread(_scan_and_clean, valid_files)
     
     embed = discord.Embed(
         title="🧹 Cleanup Complete",
         color=discord.Color.green() if cleaned else discord.Color.blue(),
-        timestamp=datetime.now(timezone.utc)
+        timestamp=utcnow()
     )
     
     if cleaned:
@@ -2132,74 +2589,53 @@ async def cleanup_command(interaction: discord.Interaction):
             inline=False
         )
     
-    embed.set_footer(text="🚀 HOPINGBOYZ VPS Manager")
+    embed.set_footer(text=EMBED_FOOTER_TEXT)
     await interaction.followup.send(embed=embed, ephemeral=True)
 
+async def _probe_command(*args: str) -> Tuple[int, str]:
+    """Run a probe command and return its exit code and stdout"""
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stdout, _ = await process.communicate()
+    return process.returncode, stdout.decode().strip()
+
+def _tool_check(path: Optional[str]) -> Dict:
+    """Turn a located tool path into a system check entry"""
+    if path:
+        return {'status': '✅', 'info': path}
+    return {'status': '❌', 'info': 'Not installed'}
+
 @bot.tree.command(name="system_check", description="🔍 [ADMIN] Check system dependencies")
+@require_admin
 async def system_check_command(interaction: discord.Interaction):
     """Check system requirements (admin only)"""
-    if not (is_admin(interaction.user.id) or (isinstance(interaction.user, discord.Member) and has_admin_role(interaction.user))):
-        embed = create_error_embed("Access Denied", "❌ This command requires admin permissions!")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        return
-    
     await interaction.response.defer(thinking=True)
     
     checks = {}
     
-    # Check QEMU
-    try:
-        process = await asyncio.create_subprocess_exec(
-            'which', 'qemu-system-x86_64',
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, _ = await process.communicate()
-        if process.returncode == 0:
-            qemu_path = stdout.decode().strip()
-            # Get version
-            process = await asyncio.create_subprocess_exec(
-                'qemu-system-x86_64', '--version',
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, _ = await process.communicate()
-            version = stdout.decode().split('\n')[0]
-            checks['qemu'] = {'status': '✅', 'info': f"{version}\nPath: {qemu_path}"}
-        else:
-            checks['qemu'] = {'status': '❌', 'info': 'Not installed'}
-    except Exception as e:
-        checks['qemu'] = {'status': '❌', 'info': str(e)}
+    # Locate the tools with PATH lookups instead of spawning `which`
+    qemu_path, localds_path, qemu_img_path = await asyncio.to_thread(
+        lambda: tuple(shutil.which(tool) for tool in ('qemu-system-x86_64', 'cloud-localds', 'qemu-img'))
+    )
+    
+    # Check QEMU (only the version query needs to run the binary)
+    checks['qemu'] = _tool_check(qemu_path)
+    if qemu_path:
+        try:
+            _, stdout = await _probe_command(qemu_path, '--version')
+            version = stdout.split('\n')[0]
+            checks['qemu']['info'] = f"{version}\nPath: {qemu_path}"
+        except Exception as e:
+            checks['qemu'] = {'status': '❌', 'info': str(e)}
     
     # Check cloud-localds
-    try:
-        process = await asyncio.create_subprocess_exec(
-            'which', 'cloud-localds',
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, _ = await process.communicate()
-        if process.returncode == 0:
-            checks['cloud-localds'] = {'status': '✅', 'info': stdout.decode().strip()}
-        else:
-            checks['cloud-localds'] = {'status': '❌', 'info': 'Not installed'}
-    except Exception as e:
-        checks['cloud-localds'] = {'status': '❌', 'info': str(e)}
+    checks['cloud-localds'] = _tool_check(localds_path)
     
     # Check qemu-img
-    try:
-        process = await asyncio.create_subprocess_exec(
-            'which', 'qemu-img',
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, _ = await process.communicate()
-        if process.returncode == 0:
-            checks['qemu-img'] = {'status': '✅', 'info': stdout.decode().strip()}
-        else:
-            checks['qemu-img'] = {'status': '❌', 'info': 'Not installed'}
-    except Exception as e:
-        checks['qemu-img'] = {'status': '❌', 'info': str(e)}
+    checks['qemu-img'] = _tool_check(qemu_img_path)
     
     # Check KVM support
     try:
@@ -2214,7 +2650,7 @@ async def system_check_command(interaction: discord.Interaction):
     try:
         if os.path.exists(VM_DIR):
             if os.access(VM_DIR, os.W_OK):
-                disk_usage = psutil.disk_usage(VM_DIR)
+                disk_usage = await asyncio.to_thread(psutil.disk_usage, VM_DIR)
                 free_gb = disk_usage.free / 1024 / 1024 / 1024
                 checks['vm_dir'] = {'status': '✅', 'info': f"Writable, {free_gb:.1f}GB free"}
             else:
@@ -2239,7 +2675,7 @@ async def system_check_command(interaction: discord.Interaction):
         title="🔍 System Dependency Check",
         description="Checking VPS Manager requirements...",
         color=discord.Color.blue(),
-        timestamp=datetime.now(timezone.utc)
+        timestamp=utcnow()
     )
     
     all_good = all(check['status'] == '✅' for check in checks.values())
@@ -2274,7 +2710,7 @@ async def system_check_command(interaction: discord.Interaction):
         embed.color = discord.Color.orange()
         embed.description = "⚠️ Some dependencies are missing or not working properly"
     
-    embed.set_footer(text="🚀 HOPINGBOYZ VPS Manager")
+    embed.set_footer(text=EMBED_FOOTER_TEXT)
     await interaction.followup.send(embed=embed, ephemeral=True)
 
 # ============================================